@@ -114,7 +114,9 @@ class TWSToolkit:
         self.capture = ScreenCapture(self.window)
         self.ocr = OCREngine(
             languages=self.config.ocr.languages,
-            use_gpu=self.config.ocr.use_gpu
+            use_gpu=self.config.ocr.use_gpu,
+            backend=self.config.ocr.engine,
+            model_path=self.config.ocr.model_path
         )
         self.regions = RegionManager(self.window)
         self.finder = ElementFinder(self.window)
@@ -177,7 +179,7 @@ class TWSToolkit:
     def disconnect(self) -> None:
         """Cleanup and disconnect from TWS."""
         self._logger.info("Disconnecting from TWS")
-        # Cleanup resources if needed
+        self.capture.close()
 
     def is_connected(self) -> bool:
         """Check if connected to TWS."""
@@ -41,11 +41,11 @@ class TimingConfig:
 @dataclass
 class OCRConfig:
     """OCR configuration."""
-    engine: str = 'easyocr'  # 'easyocr' or 'tesseract'
+    engine: str = 'easyocr'  # 'easyocr', 'onnx' or 'tesseract'
     languages: List[str] = field(default_factory=lambda: ['en'])
     use_gpu: bool = True
     confidence_threshold: float = 0.5
-    model_path: Optional[str] = None
+    model_path: Optional[str] = None  # exported models for 'onnx' engine
 
 
 @dataclass
@@ -278,7 +278,7 @@ class ConfigManager:
             errors.append("max_order_quantity must be positive")
 
         # Check OCR engine
-        if self.config.ocr.engine not in ('easyocr', 'tesseract'):
+        if self.config.ocr.engine not in ('easyocr', 'onnx', 'tesseract'):
             errors.append(f"Invalid OCR engine: {self.config.ocr.engine}")
 
         return errors
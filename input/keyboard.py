@@ -12,6 +12,7 @@ Note: Hotkeys use Win32 SendInput API directly because:
 
 from typing import List, Optional, Union
 from contextlib import contextmanager
+from types import MappingProxyType
 import ctypes
 from ctypes import wintypes
 import time
@@ -23,6 +24,110 @@ logger = logging.getLogger(__name__)
 INPUT_KEYBOARD = 1
 KEYEVENTF_KEYUP = 0x0002
 
+# GetAsyncKeyState sets the high bit while the key is held down
+KEY_PRESSED_MASK = 0x8000
+
+# OpenClipboard fails while another process holds the clipboard
+CLIPBOARD_OPEN_ATTEMPTS = 10
+CLIPBOARD_RETRY_DELAY = 0.005
+
+if hasattr(ctypes, 'windll'):
+    _GetAsyncKeyState = ctypes.windll.user32.GetAsyncKeyState
+    _GetAsyncKeyState.argtypes = [ctypes.c_int]
+    _GetAsyncKeyState.restype = ctypes.c_short
+else:
+    _GetAsyncKeyState = None
+
+
+def _open_clipboard(win32clipboard) -> bool:
+    """
+    Open clipboard, retrying briefly while another process holds it.
+
+    Returns:
+        True if opened (caller must close it), False if still busy.
+    """
+    for attempt in range(CLIPBOARD_OPEN_ATTEMPTS):
+        try:
+            win32clipboard.OpenClipboard()
+            return True
+        except Exception as e:
+            if attempt == CLIPBOARD_OPEN_ATTEMPTS - 1:
+                logger.debug(f"Clipboard busy: {e}")
+            else:
+                time.sleep(CLIPBOARD_RETRY_DELAY)
+    return False
+
+
+_SPECIAL_KEYS = MappingProxyType({
+    'enter': '{ENTER}',
+    'return': '{ENTER}',
+    'tab': '{TAB}',
+    'escape': '{ESC}',
+    'esc': '{ESC}',
+    'backspace': '{BACKSPACE}',
+    'delete': '{DELETE}',
+    'del': '{DELETE}',
+    'insert': '{INSERT}',
+    'up': '{UP}',
+    'down': '{DOWN}',
+    'left': '{LEFT}',
+    'right': '{RIGHT}',
+    'home': '{HOME}',
+    'end': '{END}',
+    'pageup': '{PGUP}',
+    'pagedown': '{PGDN}',
+    'space': ' ',
+    'f1': '{F1}', 'f2': '{F2}', 'f3': '{F3}', 'f4': '{F4}',
+    'f5': '{F5}', 'f6': '{F6}', 'f7': '{F7}', 'f8': '{F8}',
+    'f9': '{F9}', 'f10': '{F10}', 'f11': '{F11}', 'f12': '{F12}',
+})
+
+_MODIFIER_KEYS = MappingProxyType({
+    'ctrl': '^',
+    'control': '^',
+    'alt': '%',
+    'shift': '+',
+    'win': '#',
+    'windows': '#',
+})
+
+# Virtual key codes for Win32 SendInput
+_VK_CODES = MappingProxyType({
+    # Modifiers
+    'ctrl': 0x11, 'control': 0x11,
+    'alt': 0x12, 'menu': 0x12,
+    'shift': 0x10,
+    'win': 0x5B, 'windows': 0x5B,
+    # Letters
+    'a': 0x41, 'b': 0x42, 'c': 0x43, 'd': 0x44, 'e': 0x45,
+    'f': 0x46, 'g': 0x47, 'h': 0x48, 'i': 0x49, 'j': 0x4A,
+    'k': 0x4B, 'l': 0x4C, 'm': 0x4D, 'n': 0x4E, 'o': 0x4F,
+    'p': 0x50, 'q': 0x51, 'r': 0x52, 's': 0x53, 't': 0x54,
+    'u': 0x55, 'v': 0x56, 'w': 0x57, 'x': 0x58, 'y': 0x59,
+    'z': 0x5A,
+    # Numbers
+    '0': 0x30, '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x34,
+    '5': 0x35, '6': 0x36, '7': 0x37, '8': 0x38, '9': 0x39,
+    # Function keys
+    'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
+    'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
+    'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B,
+    # Special keys
+    'enter': 0x0D, 'return': 0x0D,
+    'tab': 0x09,
+    'escape': 0x1B, 'esc': 0x1B,
+    'backspace': 0x08,
+    'delete': 0x2E, 'del': 0x2E,
+    'insert': 0x2D,
+    'home': 0x24, 'end': 0x23,
+    'pageup': 0x21, 'pagedown': 0x22,
+    'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
+    'space': 0x20,
+})
+
+# Key names treated as modifiers in hotkey combinations
+_MOD_SET = frozenset(('ctrl', 'control', 'alt', 'menu', 'shift', 'win', 'windows'))
+
 
 class KEYBDINPUT(ctypes.Structure):
     """Win32 KEYBDINPUT structure for SendInput."""
@@ -59,72 +164,10 @@ class Keyboard:
         typing_interval: Delay between keystrokes.
     """
 
-    SPECIAL_KEYS = {
-        'enter': '{ENTER}',
-        'return': '{ENTER}',
-        'tab': '{TAB}',
-        'escape': '{ESC}',
-        'esc': '{ESC}',
-        'backspace': '{BACKSPACE}',
-        'delete': '{DELETE}',
-        'del': '{DELETE}',
-        'insert': '{INSERT}',
-        'up': '{UP}',
-        'down': '{DOWN}',
-        'left': '{LEFT}',
-        'right': '{RIGHT}',
-        'home': '{HOME}',
-        'end': '{END}',
-        'pageup': '{PGUP}',
-        'pagedown': '{PGDN}',
-        'space': ' ',
-        'f1': '{F1}', 'f2': '{F2}', 'f3': '{F3}', 'f4': '{F4}',
-        'f5': '{F5}', 'f6': '{F6}', 'f7': '{F7}', 'f8': '{F8}',
-        'f9': '{F9}', 'f10': '{F10}', 'f11': '{F11}', 'f12': '{F12}',
-    }
-
-    MODIFIER_KEYS = {
-        'ctrl': '^',
-        'control': '^',
-        'alt': '%',
-        'shift': '+',
-        'win': '#',
-        'windows': '#',
-    }
-
-    # Virtual key codes for Win32 SendInput
-    VK_CODES = {
-        # Modifiers
-        'ctrl': 0x11, 'control': 0x11,
-        'alt': 0x12, 'menu': 0x12,
-        'shift': 0x10,
-        'win': 0x5B, 'windows': 0x5B,
-        # Letters
-        'a': 0x41, 'b': 0x42, 'c': 0x43, 'd': 0x44, 'e': 0x45,
-        'f': 0x46, 'g': 0x47, 'h': 0x48, 'i': 0x49, 'j': 0x4A,
-        'k': 0x4B, 'l': 0x4C, 'm': 0x4D, 'n': 0x4E, 'o': 0x4F,
-        'p': 0x50, 'q': 0x51, 'r': 0x52, 's': 0x53, 't': 0x54,
-        'u': 0x55, 'v': 0x56, 'w': 0x57, 'x': 0x58, 'y': 0x59,
-        'z': 0x5A,
-        # Numbers
-        '0': 0x30, '1': 0x31, '2': 0x32, '3': 0x33, '4': 0x34,
-        '5': 0x35, '6': 0x36, '7': 0x37, '8': 0x38, '9': 0x39,
-        # Function keys
-        'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
-        'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
-        'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B,
-        # Special keys
-        'enter': 0x0D, 'return': 0x0D,
-        'tab': 0x09,
-        'escape': 0x1B, 'esc': 0x1B,
-        'backspace': 0x08,
-        'delete': 0x2E, 'del': 0x2E,
-        'insert': 0x2D,
-        'home': 0x24, 'end': 0x23,
-        'pageup': 0x21, 'pagedown': 0x22,
-        'up': 0x26, 'down': 0x28, 'left': 0x25, 'right': 0x27,
-        'space': 0x20,
-    }
+    # Aliases of the module-level mappings, kept for API compatibility
+    SPECIAL_KEYS = _SPECIAL_KEYS
+    MODIFIER_KEYS = _MODIFIER_KEYS
+    VK_CODES = _VK_CODES
 
     def __init__(self, typing_interval: float = 0.02):
         """
@@ -150,7 +193,7 @@ class Keyboard:
         interval = interval or self.typing_interval
         pyautogui.typewrite(text, interval=interval)
 
-    def type_unicode(self, text: str) -> None:
+    def type_unicode(self, text: str, restore_clipboard: bool = True) -> None:
         """
         Type unicode text (supports non-ASCII characters).
 
@@ -158,7 +201,62 @@ class Keyboard:
 
         Args:
             text: Unicode text to type.
+            restore_clipboard: Restore previous clipboard text after
+                              pasting. Pass False for bulk input where
+                              the clipboard contents don't matter.
         """
+        import pyautogui
+
+        if not restore_clipboard:
+            import pyperclip
+            pyperclip.copy(text)
+            pyautogui.hotkey('ctrl', 'v')
+            return
+
+        try:
+            import win32clipboard
+        except ImportError:
+            logger.warning("pywin32 not available, falling back to pyperclip")
+            self._type_unicode_pyperclip(text)
+            return
+
+        # Save current clipboard and set new text under one open
+        if not _open_clipboard(win32clipboard):
+            logger.warning("Clipboard busy, falling back to pyperclip")
+            self._type_unicode_pyperclip(text)
+            return
+        try:
+            try:
+                original = win32clipboard.GetClipboardData(
+                    win32clipboard.CF_UNICODETEXT
+                )
+            except Exception:
+                original = None
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+
+        pyautogui.hotkey('ctrl', 'v')
+
+        # Restore clipboard
+        if not _open_clipboard(win32clipboard):
+            logger.debug("Failed to restore clipboard: clipboard busy")
+            return
+        try:
+            try:
+                win32clipboard.EmptyClipboard()
+                if original is not None:
+                    win32clipboard.SetClipboardData(
+                        win32clipboard.CF_UNICODETEXT, original
+                    )
+            finally:
+                win32clipboard.CloseClipboard()
+        except Exception as e:
+            logger.debug(f"Failed to restore clipboard: {e}")
+
+    def _type_unicode_pyperclip(self, text: str) -> None:
+        """Clipboard paste via pyperclip, restoring previous contents."""
         import pyperclip
         import pyautogui
 
@@ -223,8 +321,8 @@ class Keyboard:
 
         # Map to special key if needed
         key_lower = key.lower()
-        if key_lower in self.SPECIAL_KEYS:
-            self.send_keys(self.SPECIAL_KEYS[key_lower])
+        if key_lower in _SPECIAL_KEYS:
+            self.send_keys(_SPECIAL_KEYS[key_lower])
         else:
             pyautogui.press(key)
 
@@ -264,7 +362,7 @@ class Keyboard:
 
         for key in keys:
             key_lower = key.lower()
-            if key_lower in ('ctrl', 'control', 'alt', 'menu', 'shift', 'win', 'windows'):
+            if key_lower in _MOD_SET:
                 modifiers.append(key_lower)
             else:
                 final_key = key_lower
@@ -274,14 +372,14 @@ class Keyboard:
             return
 
         # Get virtual key codes
-        vk_final = self.VK_CODES.get(final_key)
+        vk_final = _VK_CODES.get(final_key)
         if vk_final is None:
             logger.error(f"Unknown key: {final_key}")
             return
 
         vk_modifiers = []
         for mod in modifiers:
-            vk = self.VK_CODES.get(mod)
+            vk = _VK_CODES.get(mod)
             if vk:
                 vk_modifiers.append(vk)
 
@@ -342,15 +440,21 @@ class Keyboard:
         """
         Check if key is currently pressed.
 
+        Queries Win32 GetAsyncKeyState directly, no input hook needed.
+
         Args:
             key: Key to check.
 
         Returns:
             True if key is pressed.
         """
-        try:
-            import keyboard as kb
-            return kb.is_pressed(key)
-        except ImportError:
-            logger.warning("keyboard module not available for key state detection")
+        if _GetAsyncKeyState is None:
+            logger.warning("GetAsyncKeyState not available for key state detection")
+            return False
+
+        vk = _VK_CODES.get(key.lower())
+        if vk is None:
+            logger.error(f"Unknown key: {key}")
             return False
+
+        return bool(_GetAsyncKeyState(vk) & KEY_PRESSED_MASK)
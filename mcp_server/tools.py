@@ -4,31 +4,81 @@ MCP Tools definitions for TWS Automation.
 Defines the tools that Claude can use to control TWS.
 """
 
-import json
+import asyncio
 import logging
 import base64
-from typing import List, Dict, Any, TYPE_CHECKING
+import threading
+from typing import List, Dict, Any, Callable, Optional, TYPE_CHECKING
 from io import BytesIO
 
+try:
+    from mcp.types import Tool
+except ImportError:
+    # Return raw dicts if mcp not installed
+    Tool = dict
+
+from ..utils.serialization import dumps as _dumps
+
 if TYPE_CHECKING:
     from .. import TWSToolkit
 
 logger = logging.getLogger(__name__)
 
+# Tool definitions are static, build them once per process
+_tools_cache: Optional[List[Dict[str, Any]]] = None
+
+# Tool name -> {argument: schema default (None if not given)}
+_defaults_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
 
 def get_tools() -> List[Dict[str, Any]]:
     """
     Get list of available MCP tools.
 
+    Tool definitions are built on first call and cached.
+
     Returns:
         List of tool definitions in MCP format.
     """
-    try:
-        from mcp.types import Tool
-    except ImportError:
-        # Return raw dicts if mcp not installed
-        Tool = dict
+    global _tools_cache
+
+    if _tools_cache is None:
+        _tools_cache = _build_tools()
+
+    return list(_tools_cache)
+
+
+def get_tool_defaults() -> Dict[str, Dict[str, Any]]:
+    """
+    Get argument defaults for every tool, taken from the input schemas.
+
+    Optional arguments without a schema default map to None.
+
+    Returns:
+        Dict of tool name -> {argument name: default}.
+    """
+    global _defaults_cache
+
+    if _defaults_cache is None:
+        defaults = {}
+        for tool in get_tools():
+            if isinstance(tool, dict):
+                name, schema = tool["name"], tool["inputSchema"]
+            else:
+                name, schema = tool.name, tool.inputSchema
+            required = set(schema.get("required", ()))
+            defaults[name] = {
+                key: prop.get("default")
+                for key, prop in schema.get("properties", {}).items()
+                if key not in required
+            }
+        _defaults_cache = defaults
+
+    return _defaults_cache
+
 
+def _build_tools() -> List[Dict[str, Any]]:
+    """Build tool definitions in MCP format."""
     tools = [
         # Order tools (priority)
         Tool(
@@ -180,6 +230,12 @@ def get_tools() -> List[Dict[str, Any]]:
                     "region": {
                         "type": "string",
                         "description": "Named region to capture (optional)"
+                    },
+                    "format": {
+                        "type": "string",
+                        "enum": ["webp", "png"],
+                        "default": "webp",
+                        "description": "Image encoding (webp is smaller, png is lossless)"
                     }
                 }
             }
@@ -197,7 +253,9 @@ def get_tools() -> List[Dict[str, Any]]:
                     },
                     "pattern": {
                         "type": "string",
-                        "description": "Text pattern to find"
+                        "description": "Text pattern to find; its position "
+                                       "(x, y, width, height) is relative to "
+                                       "the TWS window, also with a region"
                     }
                 }
             }
@@ -236,151 +294,272 @@ async def handle_tool_call(
     logger.info(f"Tool call: {name} with args: {arguments}")
 
     try:
-        result = _execute_tool(toolkit, name, arguments)
-        return json.dumps(result, default=str)
+        result = await _execute_tool(toolkit, name, arguments)
+        return _dumps(result)
 
     except Exception as e:
         logger.error(f"Tool error: {e}")
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": str(e)
         })
 
 
-def _execute_tool(
+async def _execute_tool(
     toolkit: 'TWSToolkit',
     name: str,
     args: dict
 ) -> dict:
-    """Execute tool and return result dict."""
-
-    # Order tools
-    if name == "create_order":
-        result = toolkit.actions.create_order(
-            symbol=args["symbol"],
-            side=args["side"],
-            quantity=args["quantity"],
-            order_type=args.get("order_type", "LMT"),
-            limit_price=args.get("limit_price"),
-            transmit=args.get("transmit", False)
-        )
-        return _action_result_to_dict(result)
-
-    elif name == "transmit_order":
-        result = toolkit.actions.transmit_order(
-            confirm=args.get("confirm", True)
-        )
-        return _action_result_to_dict(result)
-
-    elif name == "cancel_order":
-        result = toolkit.actions.cancel_order(
-            order_id=args.get("order_id"),
-            cancel_all=args.get("cancel_all", False)
-        )
-        return _action_result_to_dict(result)
-
-    # Navigation tools
-    elif name == "search_symbol":
-        result = toolkit.actions.search_symbol(
-            symbol=args["symbol"],
-            select=args.get("select", True)
-        )
-        return _action_result_to_dict(result)
-
-    elif name == "open_chart":
-        result = toolkit.actions.open_chart(
-            symbol=args["symbol"],
-            timeframe=args.get("timeframe", "1D")
-        )
-        return _action_result_to_dict(result)
-
-    # Portfolio tools
-    elif name == "get_portfolio":
-        result = toolkit.actions.get_portfolio()
-        response = _action_result_to_dict(result)
-        if result.data:
-            response["positions"] = [
-                {
-                    "symbol": p.symbol,
-                    "quantity": p.quantity,
-                    "avg_price": p.avg_price,
-                    "current_price": p.current_price,
-                    "pnl": p.pnl
-                }
-                for p in result.data
-            ]
-        return response
-
-    elif name == "get_position":
-        result = toolkit.actions.get_position(symbol=args["symbol"])
-        response = _action_result_to_dict(result)
-        if result.data:
-            p = result.data
-            response["position"] = {
+    """
+    Execute tool and return result dict.
+
+    Handlers block on window capture, OCR and GUI input, so they run
+    in a worker thread to keep the event loop free for other calls.
+    Tools that send keyboard/mouse input are serialized so their
+    keystrokes never interleave; screen tools run concurrently.
+
+    Schema defaults are merged into the arguments up front, so handlers
+    index every declared argument directly.
+    """
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return {
+            "success": False,
+            "error": f"Unknown tool: {name}"
+        }
+
+    args = {**get_tool_defaults()[name], **args}
+
+    if name in _GUI_INPUT_TOOLS:
+        return await asyncio.to_thread(_run_with_input_lock, handler, toolkit, args)
+
+    return await asyncio.to_thread(handler, toolkit, args)
+
+
+def _run_with_input_lock(
+    handler: Callable[['TWSToolkit', dict], dict],
+    toolkit: 'TWSToolkit',
+    args: dict
+) -> dict:
+    """Run handler while holding the GUI input lock."""
+    with _input_lock:
+        return handler(toolkit, args)
+
+
+# Order tools
+
+def _create_order(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle create_order tool call."""
+    result = toolkit.actions.create_order(
+        symbol=args["symbol"],
+        side=args["side"],
+        quantity=args["quantity"],
+        order_type=args["order_type"],
+        limit_price=args["limit_price"],
+        transmit=args["transmit"]
+    )
+    return _action_result_to_dict(result)
+
+
+def _transmit_order(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle transmit_order tool call."""
+    result = toolkit.actions.transmit_order(
+        confirm=args["confirm"]
+    )
+    return _action_result_to_dict(result)
+
+
+def _cancel_order(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle cancel_order tool call."""
+    result = toolkit.actions.cancel_order(
+        order_id=args["order_id"],
+        cancel_all=args["cancel_all"]
+    )
+    return _action_result_to_dict(result)
+
+
+# Navigation tools
+
+def _search_symbol(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle search_symbol tool call."""
+    result = toolkit.actions.search_symbol(
+        symbol=args["symbol"],
+        select=args["select"]
+    )
+    return _action_result_to_dict(result)
+
+
+def _open_chart(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle open_chart tool call."""
+    result = toolkit.actions.open_chart(
+        symbol=args["symbol"],
+        timeframe=args["timeframe"]
+    )
+    return _action_result_to_dict(result)
+
+
+# Portfolio tools
+
+def _get_portfolio(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle get_portfolio tool call."""
+    result = toolkit.actions.get_portfolio()
+    response = _action_result_to_dict(result)
+    if result.data:
+        response["positions"] = [
+            {
                 "symbol": p.symbol,
                 "quantity": p.quantity,
                 "avg_price": p.avg_price,
+                "current_price": p.current_price,
                 "pnl": p.pnl
             }
-        return response
+            for p in result.data
+        ]
+    return response
+
+
+def _get_position(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle get_position tool call."""
+    result = toolkit.actions.get_position(symbol=args["symbol"])
+    response = _action_result_to_dict(result)
+    if result.data:
+        p = result.data
+        response["position"] = {
+            "symbol": p.symbol,
+            "quantity": p.quantity,
+            "avg_price": p.avg_price,
+            "pnl": p.pnl
+        }
+    return response
 
-    # Screen tools
-    elif name == "screenshot":
-        image = toolkit.capture.capture_tws()
-        if image:
-            # Convert to base64
-            buffer = BytesIO()
-            image.save(buffer, format="PNG")
-            b64 = base64.b64encode(buffer.getvalue()).decode()
-            return {
-                "success": True,
-                "image_base64": b64,
-                "width": image.width,
-                "height": image.height
-            }
-        return {"success": False, "error": "Could not capture screenshot"}
 
-    elif name == "read_screen":
+# Screen tools
+
+def _screenshot(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle screenshot tool call."""
+    bounds = _region_bounds(toolkit, args)
+    if bounds:
+        image = toolkit.capture.capture_region(bounds)
+    else:
         image = toolkit.capture.capture_tws()
-        if image:
-            if args.get("pattern"):
-                result = toolkit.ocr.find_text(image, args["pattern"])
-                if result:
-                    return {
-                        "success": True,
-                        "text": result.text,
-                        "confidence": result.confidence,
-                        "position": result.bbox
-                    }
-                return {"success": False, "error": "Text not found"}
-            else:
-                results = toolkit.ocr.read_text(image)
+    if image:
+        image_format = args["format"]
+        buffer = BytesIO()
+        if image_format == "png":
+            image.save(buffer, format="PNG", compress_level=1)
+        else:
+            image_format = "webp"
+            image.save(buffer, format="WEBP", quality=80, method=2)
+
+        # Convert to base64 (no buffer copy)
+        b64 = base64.b64encode(buffer.getbuffer()).decode('ascii')
+        return {
+            "success": True,
+            "image_base64": b64,
+            "format": image_format,
+            "width": image.width,
+            "height": image.height
+        }
+    return {"success": False, "error": "Could not capture screenshot"}
+
+
+def _read_screen(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle read_screen tool call."""
+    bounds = _region_bounds(toolkit, args)
+    if bounds:
+        image = toolkit.capture.capture_region(bounds)
+        # Report positions relative to the window, as without a region
+        region = toolkit.regions.get(args["region"], absolute=False)
+        origin_x, origin_y = region.x, region.y
+    else:
+        image = toolkit.capture.capture_tws_np()
+        origin_x = origin_y = 0
+    if image is not None:
+        pattern = args["pattern"]
+        if pattern:
+            result = toolkit.ocr.find_text(image, pattern)
+            if result:
+                x, y, width, height = result.bbox
                 return {
                     "success": True,
-                    "texts": [
-                        {"text": r.text, "confidence": r.confidence}
-                        for r in results
-                    ]
+                    "text": result.text,
+                    "confidence": result.confidence,
+                    "position": (x + origin_x, y + origin_y, width, height)
                 }
-        return {"success": False, "error": "Could not capture screen"}
+            return {"success": False, "error": "Text not found"}
+        else:
+            results = toolkit.ocr.read_text(image)
+            return {
+                "success": True,
+                "texts": [
+                    {"text": r.text, "confidence": r.confidence}
+                    for r in results
+                ]
+            }
+    return {"success": False, "error": "Could not capture screen"}
 
-    # Status tools
-    elif name == "get_status":
-        is_connected = toolkit.is_connected()
-        is_paper = toolkit._verify_paper_trading() if is_connected else None
 
-        return {
-            "success": True,
-            "connected": is_connected,
-            "paper_trading": is_paper,
-            "tws_path": toolkit.config.tws_path
-        }
+# Status tools
 
-    else:
-        return {
-            "success": False,
-            "error": f"Unknown tool: {name}"
-        }
+def _get_status(toolkit: 'TWSToolkit', args: dict) -> dict:
+    """Handle get_status tool call."""
+    is_connected = toolkit.is_connected()
+    is_paper = toolkit._verify_paper_trading() if is_connected else None
+
+    return {
+        "success": True,
+        "connected": is_connected,
+        "paper_trading": is_paper,
+        "tws_path": toolkit.config.tws_path
+    }
+
+
+# Tools that drive TWS with keyboard/mouse input; only one may run at a time
+_GUI_INPUT_TOOLS = frozenset((
+    "create_order",
+    "transmit_order",
+    "cancel_order",
+    "search_symbol",
+    "open_chart",
+    "get_portfolio",
+    "get_position",
+))
+_input_lock = threading.Lock()
+
+# Tool name -> handler(toolkit, args)
+_DISPATCH: Dict[str, Callable[['TWSToolkit', dict], dict]] = {
+    "create_order": _create_order,
+    "transmit_order": _transmit_order,
+    "cancel_order": _cancel_order,
+    "search_symbol": _search_symbol,
+    "open_chart": _open_chart,
+    "get_portfolio": _get_portfolio,
+    "get_position": _get_position,
+    "screenshot": _screenshot,
+    "read_screen": _read_screen,
+    "get_status": _get_status,
+}
+
+
+def _region_bounds(toolkit: 'TWSToolkit', args: dict) -> Optional[tuple]:
+    """
+    Resolve optional named region argument to screen bounds.
+
+    Returns:
+        Absolute bounds (x, y, width, height), or None if no region given.
+
+    Raises:
+        ValueError: If region name is unknown.
+    """
+    region_name = args["region"]
+    if not region_name:
+        return None
+
+    region = toolkit.regions.get(region_name)
+    if region is None:
+        raise ValueError(f"Unknown region: {region_name}")
+
+    return region.bounds
 
 
 def _action_result_to_dict(result) -> dict:
@@ -8,18 +8,195 @@ Provides efficient screen capture with support for:
 - Element capture
 """
 
-from typing import Tuple, Optional, TYPE_CHECKING
+from typing import Any, Callable, Tuple, Optional, TYPE_CHECKING
 from PIL import Image
+import functools
+import ctypes
+import threading
+import weakref
 import logging
 
+# Optional dependencies are imported once here; methods check for None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    import mss
+except ImportError:
+    mss = None
+
+try:
+    import win32gui
+    import win32ui
+    import win32con
+except ImportError:
+    win32gui = win32ui = win32con = None
+
+try:
+    import pyautogui
+except Exception:
+    # pyautogui raises non-ImportError errors without a display
+    pyautogui = None
+
 if TYPE_CHECKING:
     from ..core.window import TWSWindow
     from ..core.element import Element
-    import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def _require(module, name: str):
+    """
+    Return imported module or raise ImportError if missing.
+
+    Args:
+        module: Module object or None if import failed.
+        name: Package name for the error message.
+    """
+    if module is None:
+        raise ImportError(f"{name} is required for this operation but not installed")
+    return module
+
+# PrintWindow flag: render DirectComposition/GPU content too (Windows 8.1+)
+PW_RENDERFULLCONTENT = 0x00000002
+
+# GetDIBits constants
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    """Win32 BITMAPINFOHEADER structure."""
+    _fields_ = [
+        ('biSize', ctypes.c_uint32),
+        ('biWidth', ctypes.c_int32),
+        ('biHeight', ctypes.c_int32),
+        ('biPlanes', ctypes.c_uint16),
+        ('biBitCount', ctypes.c_uint16),
+        ('biCompression', ctypes.c_uint32),
+        ('biSizeImage', ctypes.c_uint32),
+        ('biXPelsPerMeter', ctypes.c_int32),
+        ('biYPelsPerMeter', ctypes.c_int32),
+        ('biClrUsed', ctypes.c_uint32),
+        ('biClrImportant', ctypes.c_uint32),
+    ]
+
+
+class BITMAPINFO(ctypes.Structure):
+    """Win32 BITMAPINFO structure (header + one color entry)."""
+    _fields_ = [
+        ('bmiHeader', BITMAPINFOHEADER),
+        ('bmiColors', ctypes.c_uint32 * 1),
+    ]
+
+
+def _make_bitmap_info(width: int, height: int) -> BITMAPINFO:
+    """Describe a top-down 32-bit BGRX DIB of given size."""
+    bmi = BITMAPINFO()
+    header = bmi.bmiHeader
+    header.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+    header.biWidth = width
+    header.biHeight = -height  # negative height = top-down rows
+    header.biPlanes = 1
+    header.biBitCount = 32
+    header.biCompression = BI_RGB
+    return bmi
+
+# Without OpenCV, images of at least this many bytes (4K RGB)
+# use the multi-core Numba SAD kernel
+NUMBA_SAD_MIN_SIZE = 3840 * 2160 * 3
+
+# Perceptual hash parameters: DCT of 32x32 grayscale, keep 8x8 low frequencies
+PHASH_SIZE = 32
+PHASH_LOW_FREQ = 8
+
+# pHash per live image, keyed by id(); entries are dropped when the
+# image is garbage collected. Not kept in image.info, which PIL copies
+# into every derived image (crop, convert, resize, ...).
+_phash_cache: dict = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _dct_matrix(n: int) -> 'np.ndarray':
+    """Orthogonal DCT-II basis matrix of size n x n."""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    return np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sad_kernel():
+    """
+    Build Numba-compiled sum-of-absolute-differences kernel.
+
+    Compiled lazily on first use; cache=True keeps the machine
+    code on disk so later processes skip the JIT step.
+
+    Returns:
+        Kernel taking two 2D uint8 arrays, or None if numba missing.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def sad_kernel(a, b):
+        total = 0
+        for i in prange(a.shape[0]):
+            acc = 0
+            for j in range(a.shape[1]):
+                # Widen before subtracting, uint8 operands would wrap
+                acc += abs(np.int32(a[i, j]) - np.int32(b[i, j]))
+            total += acc
+        return total
+
+    return sad_kernel
+
+
+def _phash(image: Image.Image) -> int:
+    """
+    Compute 64-bit perceptual hash (pHash) of image.
+
+    The hash is cached for the lifetime of the image object,
+    so an image must not be modified in place after it was hashed.
+
+    Args:
+        image: PIL Image.
+
+    Returns:
+        Hash as 64-bit integer.
+    """
+    key = id(image)
+    cached = _phash_cache.get(key)
+    if cached is not None:
+        return cached
+
+    _require(np, 'numpy')
+
+    small = image.convert('L').resize((PHASH_SIZE, PHASH_SIZE), Image.BILINEAR)
+    pixels = np.asarray(small, dtype=np.float64)
+
+    dct = _dct_matrix(PHASH_SIZE)
+    coeffs = dct @ pixels @ dct.T
+    low = coeffs[:PHASH_LOW_FREQ, :PHASH_LOW_FREQ].ravel()
+
+    # Median excludes the DC term, which dominates the low frequencies
+    bits = low > np.median(low[1:])
+    value = int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+    _phash_cache[key] = value
+    weakref.finalize(image, _phash_cache.pop, key, None)
+    return value
+
+
 class ScreenCapture:
     """
     Screenshot capture with window-specific support.
@@ -41,6 +218,47 @@ class ScreenCapture:
         """
         self.window = window
 
+        # mss instances are not thread-safe, keep one per thread;
+        # every instance is also tracked so close() can release all
+        # of them, not just the calling thread's
+        self._local = threading.local()
+        self._scts: list = []
+        self._sct_generation = 0
+        self._sct_lock = threading.Lock()
+        self._mss_available = mss is not None
+        if not self._mss_available:
+            logger.warning("mss not installed, falling back to pyautogui capture")
+
+        # Cached GDI objects and pixel buffer per window handle:
+        # hwnd -> (hwnd_dc, mfc_dc, save_dc, bitmap, bmi, buffer, width, height)
+        self._dc_cache: dict = {}
+        self._dc_lock = threading.Lock()
+
+    def _get_sct(self):
+        """
+        Get mss screen grabber for current thread.
+
+        Returns:
+            mss instance, or None if mss is not installed.
+        """
+        if not self._mss_available:
+            return None
+
+        sct = getattr(self._local, 'sct', None)
+        if sct is None or self._local.generation != self._sct_generation:
+            # First use on this thread, or closed since
+            sct = mss.mss()
+            with self._sct_lock:
+                self._scts.append(sct)
+                self._local.generation = self._sct_generation
+            self._local.sct = sct
+        return sct
+
+    def _grab(self, sct, monitor: dict) -> Image.Image:
+        """Grab screen area with mss and wrap it as RGB PIL Image."""
+        shot = sct.grab(monitor)
+        return Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+
     def capture_screen(self) -> Image.Image:
         """
         Capture entire screen.
@@ -48,8 +266,12 @@ class ScreenCapture:
         Returns:
             PIL Image of full screen.
         """
-        import pyautogui
-        return pyautogui.screenshot()
+        sct = self._get_sct()
+        if sct is not None:
+            # monitors[0] spans all monitors, [1] is the primary screen
+            return self._grab(sct, sct.monitors[1])
+
+        return _require(pyautogui, 'pyautogui').screenshot()
 
     def capture_region(
         self,
@@ -64,17 +286,25 @@ class ScreenCapture:
         Returns:
             PIL Image of region.
         """
-        import pyautogui
-
         x, y, width, height = region
-        return pyautogui.screenshot(region=(x, y, width, height))
+
+        sct = self._get_sct()
+        if sct is not None:
+            return self._grab(sct, {
+                "left": x, "top": y, "width": width, "height": height
+            })
+
+        return _require(pyautogui, 'pyautogui').screenshot(
+            region=(x, y, width, height)
+        )
 
     def capture_window(self, hwnd: int = None) -> Optional[Image.Image]:
         """
         Capture specific window by handle.
 
-        Uses Win32 API for window capture, which works
-        even for partially obscured windows.
+        Uses Win32 PrintWindow, which asks the window to render
+        itself and works even for partially obscured windows.
+        Falls back to BitBlt from the window DC if PrintWindow fails.
 
         Args:
             hwnd: Window handle (uses TWS window if None).
@@ -82,69 +312,215 @@ class ScreenCapture:
         Returns:
             PIL Image of window, or None on failure.
         """
+        hwnd = self._resolve_hwnd(hwnd)
         if hwnd is None:
-            if self.window and self.window.hwnd:
-                hwnd = self.window.hwnd
-            else:
-                logger.warning("No window handle available")
-                return None
+            return None
 
         try:
-            import win32gui
-            import win32ui
-            import win32con
+            return self._grab_window(hwnd, self._bits_to_image)
+        except ImportError:
+            logger.warning("pywin32 not installed, falling back to region capture")
+            return self._capture_window_rect()
+
+    def capture_window_np(self, hwnd: int = None) -> Optional['np.ndarray']:
+        """
+        Capture specific window by handle as numpy array.
 
+        Same as capture_window(), but builds the array directly
+        from the pixel buffer, skipping the PIL Image round-trip.
+
+        Args:
+            hwnd: Window handle (uses TWS window if None).
+
+        Returns:
+            RGB numpy array (height, width, 3), or None on failure.
+        """
+        _require(np, 'numpy')
+
+        hwnd = self._resolve_hwnd(hwnd)
+        if hwnd is None:
+            return None
+
+        try:
+            return self._grab_window(hwnd, self._bits_to_array)
+        except ImportError:
+            logger.warning("pywin32 not installed, falling back to region capture")
+            image = self._capture_window_rect()
+            return np.asarray(image) if image is not None else None
+
+    @staticmethod
+    def _bits_to_image(buffer, width: int, height: int) -> Image.Image:
+        """Decode BGRX pixel buffer into a new RGB PIL Image."""
+        return Image.frombuffer(
+            'RGB', (width, height), buffer, 'raw', 'BGRX', 0, 1
+        )
+
+    @staticmethod
+    def _bits_to_array(buffer, width: int, height: int) -> 'np.ndarray':
+        """Copy BGRX pixel buffer into a new RGB numpy array."""
+        bgrx = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+
+        # BGRX -> RGB in a single copy
+        return np.ascontiguousarray(bgrx[:, :, 2::-1])
+
+    def _resolve_hwnd(self, hwnd: Optional[int]) -> Optional[int]:
+        """Get window handle to capture, defaulting to TWS window."""
+        if hwnd is None:
+            if self.window and self.window.hwnd:
+                return self.window.hwnd
+            logger.warning("No window handle available")
+        return hwnd
+
+    def _capture_window_rect(self) -> Optional[Image.Image]:
+        """Capture TWS window area from screen (no pywin32 needed)."""
+        if self.window:
+            rect = self.window.get_window_rect()
+            if rect:
+                left, top, right, bottom = rect
+                return self.capture_region((left, top, right - left, bottom - top))
+        return None
+
+    def _grab_window(
+        self,
+        hwnd: int,
+        convert: Callable[[Any, int, int], Any]
+    ) -> Any:
+        """
+        Render window into cached bitmap and convert its pixels.
+
+        Pixels are read with GetDIBits into a buffer that is reused
+        across captures, so convert() runs while the buffer is locked
+        and must copy out whatever it returns.
+
+        Args:
+            hwnd: Window handle.
+            convert: Called as convert(buffer, width, height) with
+                     the top-down BGRX pixel buffer.
+
+        Returns:
+            Result of convert(), or None on failure.
+
+        Raises:
+            ImportError: If pywin32 is not installed.
+        """
+        _require(win32gui, 'pywin32')
+
+        try:
             # Get window dimensions
             left, top, right, bottom = win32gui.GetWindowRect(hwnd)
             width = right - left
             height = bottom - top
 
-            # Create device contexts
-            hwnd_dc = win32gui.GetWindowDC(hwnd)
-            mfc_dc = win32ui.CreateDCFromHandle(hwnd_dc)
-            save_dc = mfc_dc.CreateCompatibleDC()
-
-            # Create bitmap
-            bitmap = win32ui.CreateBitmap()
-            bitmap.CreateCompatibleBitmap(mfc_dc, width, height)
-            save_dc.SelectObject(bitmap)
-
-            # Copy window to bitmap
-            save_dc.BitBlt(
-                (0, 0), (width, height),
-                mfc_dc, (0, 0),
-                win32con.SRCCOPY
-            )
+            with self._dc_lock:
+                mfc_dc, save_dc, bitmap, bmi, buffer = self._get_window_dc(
+                    hwnd, width, height
+                )
+
+                # Render window into bitmap
+                rendered = ctypes.windll.user32.PrintWindow(
+                    hwnd, save_dc.GetSafeHdc(), PW_RENDERFULLCONTENT
+                )
+                if not rendered:
+                    # Copy visible window pixels instead
+                    save_dc.BitBlt(
+                        (0, 0), (width, height),
+                        mfc_dc, (0, 0),
+                        win32con.SRCCOPY
+                    )
+
+                # Read pixels straight into the reusable buffer
+                lines = ctypes.windll.gdi32.GetDIBits(
+                    save_dc.GetSafeHdc(), bitmap.GetHandle(),
+                    0, height, buffer, ctypes.byref(bmi), DIB_RGB_COLORS
+                )
+                if lines != height:
+                    raise OSError(f"GetDIBits copied {lines} of {height} lines")
+
+                return convert(buffer, width, height)
+
+        except Exception as e:
+            logger.error(f"Window capture failed: {e}")
+            # Window may be gone, drop its cached DCs
+            with self._dc_lock:
+                self._release_window_dc(hwnd)
+            return None
 
-            # Convert to PIL Image
-            bmpinfo = bitmap.GetInfo()
-            bmpstr = bitmap.GetBitmapBits(True)
+    def _get_window_dc(self, hwnd: int, width: int, height: int) -> tuple:
+        """
+        Get cached device contexts, bitmap and pixel buffer for window.
 
-            image = Image.frombuffer(
-                'RGB',
-                (bmpinfo['bmWidth'], bmpinfo['bmHeight']),
-                bmpstr, 'raw', 'BGRX', 0, 1
-            )
+        Creates new GDI objects and buffer only on first use or when
+        the window size changes. Caller must hold _dc_lock.
 
-            # Cleanup
+        Args:
+            hwnd: Window handle.
+            width: Current window width.
+            height: Current window height.
+
+        Returns:
+            Tuple (mfc_dc, save_dc, bitmap, bmi, buffer).
+        """
+        entry = self._dc_cache.get(hwnd)
+        if entry is not None:
+            if entry[6] == width and entry[7] == height:
+                return entry[1:6]
+            self._release_window_dc(hwnd)
+
+        # Create device contexts
+        hwnd_dc = win32gui.GetWindowDC(hwnd)
+        mfc_dc = win32ui.CreateDCFromHandle(hwnd_dc)
+        save_dc = mfc_dc.CreateCompatibleDC()
+
+        # Create bitmap
+        bitmap = win32ui.CreateBitmap()
+        bitmap.CreateCompatibleBitmap(mfc_dc, width, height)
+        save_dc.SelectObject(bitmap)
+
+        # Pixel buffer filled by GetDIBits, 4 bytes per pixel
+        bmi = _make_bitmap_info(width, height)
+        buffer = (ctypes.c_uint8 * (width * height * 4))()
+
+        self._dc_cache[hwnd] = (
+            hwnd_dc, mfc_dc, save_dc, bitmap, bmi, buffer, width, height
+        )
+        return mfc_dc, save_dc, bitmap, bmi, buffer
+
+    def _release_window_dc(self, hwnd: int) -> None:
+        """Release cached GDI objects for window. Caller must hold _dc_lock."""
+        entry = self._dc_cache.pop(hwnd, None)
+        if entry is None:
+            return
+
+        hwnd_dc, mfc_dc, save_dc, bitmap = entry[:4]
+        try:
             win32gui.DeleteObject(bitmap.GetHandle())
             save_dc.DeleteDC()
             mfc_dc.DeleteDC()
             win32gui.ReleaseDC(hwnd, hwnd_dc)
-
-            return image
-
-        except ImportError:
-            logger.warning("pywin32 not installed, falling back to region capture")
-            if self.window:
-                rect = self.window.get_window_rect()
-                if rect:
-                    left, top, right, bottom = rect
-                    return self.capture_region((left, top, right - left, bottom - top))
-            return None
         except Exception as e:
-            logger.error(f"Window capture failed: {e}")
-            return None
+            logger.debug(f"Failed to release window DC: {e}")
+
+    def close(self) -> None:
+        """Release cached capture resources."""
+        with self._dc_lock:
+            for hwnd in list(self._dc_cache):
+                self._release_window_dc(hwnd)
+
+        # Threads still holding a closed instance create a new one
+        with self._sct_lock:
+            scts, self._scts = self._scts, []
+            self._sct_generation += 1
+        for sct in scts:
+            try:
+                sct.close()
+            except Exception as e:
+                logger.debug(f"Failed to close mss instance: {e}")
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def capture_element(self, element: 'Element') -> Optional[Image.Image]:
         """
@@ -170,6 +546,15 @@ class ScreenCapture:
         """
         return self.capture_window()
 
+    def capture_tws_np(self) -> Optional['np.ndarray']:
+        """
+        Capture TWS main window as numpy array.
+
+        Returns:
+            RGB numpy array of TWS window.
+        """
+        return self.capture_window_np()
+
     def save(self, image: Image.Image, path: str) -> None:
         """
         Save image to file.
@@ -193,14 +578,16 @@ class ScreenCapture:
         Returns:
             Numpy array (BGR format for OpenCV).
         """
-        import numpy as np
+        _require(np, 'numpy')
 
         # Convert to RGB if needed
         if image.mode != 'RGB':
             image = image.convert('RGB')
 
         # Convert to numpy and swap RGB to BGR for OpenCV
-        arr = np.array(image)
+        arr = np.asarray(image)
+        if cv2 is not None:
+            return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
         return arr[:, :, ::-1].copy()
 
     def from_numpy(self, array: 'np.ndarray') -> Image.Image:
@@ -213,11 +600,12 @@ class ScreenCapture:
         Returns:
             PIL Image.
         """
-        import numpy as np
-
-        # Assume BGR, convert to RGB
-        if len(array.shape) == 3 and array.shape[2] == 3:
-            array = array[:, :, ::-1]
+        # Assume BGR, convert to RGB (cvtColor handles uint8 only)
+        if array.ndim == 3 and array.shape[2] == 3:
+            if cv2 is not None and array.dtype == np.uint8:
+                array = cv2.cvtColor(array, cv2.COLOR_BGR2RGB)
+            else:
+                array = array[:, :, ::-1]
 
         return Image.fromarray(array)
 
@@ -225,7 +613,8 @@ class ScreenCapture:
         self,
         image1: Image.Image,
         image2: Image.Image,
-        threshold: float = 0.95
+        threshold: float = 0.95,
+        max_hash_distance: int = None
     ) -> bool:
         """
         Compare two images for similarity.
@@ -234,21 +623,53 @@ class ScreenCapture:
             image1: First image.
             image2: Second image.
             threshold: Similarity threshold (0-1).
+            max_hash_distance: If set, first compare perceptual hashes
+                              and return False without a pixel
+                              comparison when they differ in more
+                              than this many bits (0-64).
 
         Returns:
             True if images are similar above threshold.
         """
-        import numpy as np
+        _require(np, 'numpy')
 
         if image1.size != image2.size:
             return False
 
-        arr1 = np.array(image1)
-        arr2 = np.array(image2)
+        if max_hash_distance is not None:
+            distance = (_phash(image1) ^ _phash(image2)).bit_count()
+            if distance > max_hash_distance:
+                return False
+
+        arr1 = np.asarray(image1)
+        arr2 = np.asarray(image2)
+
+        # OpenCV and Numba paths need matching uint8 arrays; other
+        # modes ('1', 'I', 'F', ...) use the numpy reference below
+        both_uint8 = (
+            arr1.dtype == np.uint8 and arr2.dtype == np.uint8
+            and arr1.shape == arr2.shape
+        )
+
+        # Sum of absolute differences without float promotion
+        sad_kernel = None
+        if both_uint8 and cv2 is None and arr1.size >= NUMBA_SAD_MIN_SIZE:
+            sad_kernel = _get_sad_kernel()
+
+        if both_uint8 and cv2 is not None:
+            total = cv2.norm(arr1, arr2, cv2.NORM_L1)
+        elif sad_kernel is not None:
+            total = sad_kernel(
+                arr1.reshape(arr1.shape[0], -1),
+                arr2.reshape(arr2.shape[0], -1)
+            )
+        else:
+            dtype = np.int16 if both_uint8 else np.float64
+            diff = np.subtract(arr1, arr2, dtype=dtype)
+            total = np.abs(diff, out=diff).sum(dtype=np.float64)
 
         # Calculate similarity
-        diff = np.abs(arr1.astype(float) - arr2.astype(float))
         max_diff = 255.0 * arr1.size
-        similarity = 1.0 - (np.sum(diff) / max_diff)
+        similarity = 1.0 - (float(total) / max_diff)
 
         return similarity >= threshold
@@ -0,0 +1,131 @@
+"""
+Export EasyOCR models for the ONNX OCR backend.
+
+Writes the files ONNXOCRBackend loads (craft.onnx, crnn.onnx and
+crnn_charset.txt). Needs easyocr and torch, which the 'onnx' engine
+itself does not; run it once on any machine with them installed and
+copy the output directory over.
+
+Usage:
+    python -m tws_automation.screen.export_onnx
+    python -m tws_automation.screen.export_onnx --lang en --output C:/models/ocr
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from typing import List
+
+from .ocr import ONNXOCRBackend
+
+logger = logging.getLogger(__name__)
+
+OPSET_VERSION = 17
+
+
+def export_models(
+    languages: List[str],
+    output_dir: Path = ONNXOCRBackend.DEFAULT_MODEL_DIR
+) -> Path:
+    """
+    Export EasyOCR detector, recognizer and charset to output_dir.
+
+    Args:
+        languages: EasyOCR languages; decide which recognizer is exported.
+        output_dir: Directory for the exported files (created if needed).
+
+    Returns:
+        Output directory.
+    """
+    import torch
+    import easyocr
+
+    class MeanLastAxis(torch.nn.Module):
+        """Same as AdaptiveAvgPool2d((None, 1)), but exportable."""
+
+        def forward(self, x):
+            return x.mean(dim=3, keepdim=True)
+
+    class Recognizer(torch.nn.Module):
+        """CRNN with a single image input, as ONNXOCRBackend calls it."""
+
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+            # Adaptive pooling does not export with a dynamic width
+            self.model.AdaptiveAvgPool = MeanLastAxis()
+
+        def forward(self, image):
+            return self.model(image, None)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Unquantized CPU models; dynamic quantization does not export
+    reader = easyocr.Reader(languages, gpu=False, quantize=False, verbose=False)
+    detector = getattr(reader.detector, 'module', reader.detector).eval()
+    recognizer = Recognizer(
+        getattr(reader.recognizer, 'module', reader.recognizer)
+    ).eval()
+
+    with torch.no_grad():
+        torch.onnx.export(
+            detector,
+            torch.zeros(1, 3, 640, 640),
+            str(output_dir / ONNXOCRBackend.DETECTOR_FILE),
+            input_names=['image'],
+            output_names=['scores', 'features'],
+            dynamic_axes={
+                'image': {0: 'batch', 2: 'height', 3: 'width'},
+                'scores': {0: 'batch', 1: 'height', 2: 'width'},
+            },
+            opset_version=OPSET_VERSION,
+        )
+        logger.info(f"Exported detector to {output_dir / ONNXOCRBackend.DETECTOR_FILE}")
+
+        torch.onnx.export(
+            recognizer,
+            torch.zeros(1, 1, ONNXOCRBackend.RECOGNIZER_HEIGHT, 256),
+            str(output_dir / ONNXOCRBackend.RECOGNIZER_FILE),
+            input_names=['image'],
+            output_names=['logits'],
+            dynamic_axes={
+                'image': {0: 'batch', 3: 'width'},
+                'logits': {0: 'batch', 1: 'steps'},
+            },
+            opset_version=OPSET_VERSION,
+        )
+        logger.info(f"Exported recognizer to {output_dir / ONNXOCRBackend.RECOGNIZER_FILE}")
+
+    # Class i + 1 of the recognizer output is charset[i] (0 is the CTC blank)
+    (output_dir / ONNXOCRBackend.CHARSET_FILE).write_text(
+        reader.character + '\n', encoding='utf-8'
+    )
+
+    return output_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export EasyOCR models for the onnx OCR engine'
+    )
+    parser.add_argument(
+        '--lang', nargs='+', default=['en'],
+        help='EasyOCR languages (default: en)'
+    )
+    parser.add_argument(
+        '--output', type=Path, default=ONNXOCRBackend.DEFAULT_MODEL_DIR,
+        help=f'Output directory (default: {ONNXOCRBackend.DEFAULT_MODEL_DIR})'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    output_dir = export_models(args.lang, args.output)
+    print(f"Exported OCR models to {output_dir}")
+
+
+if __name__ == '__main__':
+    main()
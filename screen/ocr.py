@@ -7,19 +7,107 @@ Optimized for trading application text recognition:
 - Table data extraction
 """
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
 from abc import ABC, abstractmethod
+from pathlib import Path
+import functools
+import hashlib
+import os
 import re
+import string
+import threading
 import logging
 
 if TYPE_CHECKING:
+    import numpy as np
     from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# Motion gate: regions are compared as MOTION_THUMB_SIZE grayscale
+# thumbnails; a mean absolute difference below MOTION_THRESHOLD
+# counts as unchanged
+MOTION_THUMB_SIZE = (32, 32)
+MOTION_THRESHOLD = 4.0
 
-@dataclass
+# Patterns for financial data (compiled once at import)
+_PRICE_RE = re.compile(r'\d+\.?\d*')
+_SYMBOL_RE = re.compile(r'^[A-Z]{1,5}$')
+_PERCENT_RE = re.compile(r'[+-]?\d+\.?\d*%')
+_QUANTITY_RE = re.compile(r'^\d+$')
+
+# Characters the recognizer may output when reading specific fields
+SYMBOL_CHARS = string.ascii_uppercase
+PRICE_CHARS = string.digits + '.,+-%'
+
+
+def _parse_price(text: str) -> Optional[float]:
+    """
+    Parse text that is a plain number ("123", "123.45").
+
+    Uses str methods only, which is cheaper than a regex search
+    for the clean field text OCR returns with a price allowlist.
+
+    Returns:
+        Number as float, or None if text is anything else.
+    """
+    if (text.isascii()
+            and text.replace('.', '', 1).isdigit()
+            and text[0] != '.'):
+        return float(text)
+    return None
+
+
+def _cluster_rows(ys_sorted: 'np.ndarray', row_threshold: int) -> 'np.ndarray':
+    """
+    Assign table row ids to sorted Y coordinates.
+
+    A new row starts wherever the gap to the previous
+    coordinate is at least row_threshold.
+
+    Returns:
+        Row id per coordinate (0, 0, 1, ...).
+    """
+    import numpy as np
+
+    labels = np.zeros(len(ys_sorted), dtype=np.int64)
+    np.cumsum(np.diff(ys_sorted) >= row_threshold, out=labels[1:])
+    return labels
+
+
+def _half_inputs(module, args: tuple) -> tuple:
+    """Forward pre-hook: cast floating point tensor inputs to FP16."""
+    return tuple(
+        arg.half() if hasattr(arg, 'is_floating_point') and arg.is_floating_point()
+        else arg
+        for arg in args
+    )
+
+
+def _float_outputs(module, args: tuple, output):
+    """
+    Forward hook: cast FP16 model outputs back to FP32.
+
+    EasyOCR post-processes outputs with numpy and OpenCV,
+    and cv2.threshold() rejects float16 score maps.
+    """
+    if isinstance(output, (tuple, list)):
+        return type(output)(_float_outputs(module, args, o) for o in output)
+    if hasattr(output, 'is_floating_point') and output.is_floating_point():
+        return output.float()
+    return output
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(pattern: str) -> 're.Pattern':
+    """Compile case-insensitive search pattern (cached)."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class OCRResult:
     """
     OCR detection result.
@@ -44,8 +132,16 @@ class OCRBackend(ABC):
     """Abstract OCR backend interface."""
 
     @abstractmethod
-    def read(self, image: 'Image') -> List[OCRResult]:
-        """Read all text from image."""
+    def read(
+        self,
+        image: 'Image',
+        allowlist: Optional[str] = None
+    ) -> List[OCRResult]:
+        """
+        Read all text from image (PIL Image or RGB numpy array).
+
+        If allowlist is given, only those characters are recognized.
+        """
         pass
 
     @abstractmethod
@@ -53,53 +149,211 @@ class OCRBackend(ABC):
         """Check if backend is available."""
         pass
 
+    def read_batch(self, images: List['Image']) -> List[List[OCRResult]]:
+        """Read all text from several images (one read per image)."""
+        return [self.read(image) for image in images]
+
 
 class EasyOCRBackend(OCRBackend):
     """EasyOCR backend implementation."""
 
-    def __init__(self, languages: List[str], use_gpu: bool):
+    # Longer side the text detector works at; larger images are
+    # downscaled for detection only, recognition reads full resolution
+    DETECT_SIZE = 1920
+
+    # Synthetic text image read once after loading (height, width, channels);
+    # it needs text so the recognizer runs, not just the detector
+    WARMUP_SHAPE = (96, 480, 3)
+    WARMUP_TEXT = 'AAPL 123.45'
+
+    def __init__(
+        self,
+        languages: List[str],
+        use_gpu: bool,
+        detect_size: int = DETECT_SIZE,
+        fp16: bool = True
+    ):
         self.languages = languages
         self.use_gpu = use_gpu
+        self.detect_size = detect_size
+        self.fp16 = fp16
+        self.device: Optional[str] = None
         self._reader = None
+        self._reader_lock = threading.Lock()
 
     @property
     def reader(self):
         """Lazy initialization of EasyOCR reader."""
         if self._reader is None:
-            import easyocr
-            self._reader = easyocr.Reader(
-                self.languages,
-                gpu=self.use_gpu
-            )
+            # Reads may come from worker threads, load the model only once
+            with self._reader_lock:
+                if self._reader is None:
+                    import easyocr
+                    self.device = self._select_device()
+                    logger.info(f"Loading EasyOCR on device: {self.device}")
+                    reader = easyocr.Reader(
+                        self.languages,
+                        gpu=self.device if self.device != 'cpu' else False
+                    )
+                    if self.fp16 and self.device == 'cuda':
+                        self._to_half(reader)
+                    self._warmup(reader)
+                    self._reader = reader
         return self._reader
 
-    def read(self, image: 'Image') -> List[OCRResult]:
+    def _warmup(self, reader) -> None:
+        """
+        Read a small text image once, so the first real read is not
+        slowed by lazy kernel selection and memory allocation in
+        either network. Called once, while loading the reader.
+        """
+        try:
+            reader.readtext(self._warmup_image(), canvas_size=self.detect_size)
+        except Exception as e:
+            logger.warning(f"OCR warmup failed: {e}")
+
+    @classmethod
+    def _warmup_image(cls) -> 'np.ndarray':
+        """Black text on white background, like a TWS data field."""
         import numpy as np
+        import cv2
+
+        image = np.full(cls.WARMUP_SHAPE, 255, dtype=np.uint8)
+        cv2.putText(
+            image, cls.WARMUP_TEXT, (16, 64),
+            cv2.FONT_HERSHEY_SIMPLEX, 1.5, (0, 0, 0), 3, cv2.LINE_AA
+        )
+        return image
 
-        # Convert PIL to numpy
-        img_array = np.array(image)
+    def _select_device(self) -> str:
+        """
+        Pick torch device for EasyOCR.
 
-        results = []
-        detections = self.reader.readtext(img_array)
+        Returns:
+            'cuda' or 'mps' if GPU use is enabled and available,
+            otherwise 'cpu'.
+        """
+        if not self.use_gpu:
+            return 'cpu'
+
+        import torch
 
-        for detection in detections:
-            bbox_points, text, confidence = detection
+        if torch.cuda.is_available():
+            return 'cuda'
 
-            # Convert polygon to bounding box
-            x_coords = [p[0] for p in bbox_points]
-            y_coords = [p[1] for p in bbox_points]
-            x = int(min(x_coords))
-            y = int(min(y_coords))
-            w = int(max(x_coords) - x)
-            h = int(max(y_coords) - y)
+        mps = getattr(torch.backends, 'mps', None)
+        if mps is not None and mps.is_available():
+            return 'mps'
 
-            results.append(OCRResult(
+        logger.warning("GPU requested for OCR but no CUDA/MPS device found, using CPU")
+        return 'cpu'
+
+    def read(
+        self,
+        image: 'Image',
+        allowlist: Optional[str] = None
+    ) -> List[OCRResult]:
+        import numpy as np
+
+        # Convert PIL to numpy (arrays are passed through without a copy)
+        img_array = np.asarray(image)
+
+        # Detector cost grows with pixel count, cap its input size;
+        # EasyOCR maps boxes back to full-resolution coordinates
+        detections = self.reader.readtext(
+            img_array,
+            canvas_size=self.detect_size,
+            allowlist=allowlist
+        )
+        return self._to_results(detections)
+
+    def read_batch(
+        self,
+        images: List['Image'],
+        n_width: int = 800,
+        n_height: int = 600
+    ) -> List[List[OCRResult]]:
+        """
+        Read all text from several images in one batched pass.
+
+        EasyOCR resizes every image to n_width x n_height so the
+        batch runs through the network as a single tensor. Bounding
+        boxes are scaled back to each image's own coordinates.
+
+        Args:
+            images: PIL Images or RGB numpy arrays.
+            n_width: Common width images are resized to.
+            n_height: Common height images are resized to.
+
+        Returns:
+            One list of OCRResult objects per input image.
+        """
+        import numpy as np
+
+        if not images:
+            return []
+
+        arrays = [np.asarray(image) for image in images]
+        batch = self.reader.readtext_batched(
+            arrays,
+            n_width=n_width,
+            n_height=n_height
+        )
+
+        return [
+            self._to_results(
+                detections,
+                scale_x=arr.shape[1] / n_width,
+                scale_y=arr.shape[0] / n_height
+            )
+            for arr, detections in zip(arrays, batch)
+        ]
+
+    @staticmethod
+    def _to_half(reader) -> None:
+        """
+        Run reader's detector and recognizer in FP16 (CUDA only).
+
+        Uses tensor cores and half the memory traffic. Inputs are
+        cast to FP16 on the way in, and outputs back to FP32 before
+        EasyOCR's numpy/OpenCV post-processing sees them.
+        """
+        for model in (reader.detector, reader.recognizer):
+            model.half()
+            model.register_forward_pre_hook(_half_inputs)
+            model.register_forward_hook(_float_outputs)
+
+    @staticmethod
+    def _to_results(
+        detections: list,
+        scale_x: float = 1.0,
+        scale_y: float = 1.0
+    ) -> List[OCRResult]:
+        """Convert EasyOCR detections to OCRResult objects."""
+        import numpy as np
+
+        if not detections:
+            return []
+
+        # Convert all polygons to bounding boxes at once: (N, 4, 2) points
+        points = np.asarray(
+            [detection[0] for detection in detections], dtype=np.float64
+        )
+        if scale_x != 1.0 or scale_y != 1.0:
+            points *= (scale_x, scale_y)
+
+        top_left = points.min(axis=1).astype(np.int64)
+        size = (points.max(axis=1) - top_left).astype(np.int64)
+        boxes = np.hstack((top_left, size)).tolist()
+
+        return [
+            OCRResult(
                 text=text,
                 confidence=confidence,
-                bbox=(x, y, w, h)
-            ))
-
-        return results
+                bbox=tuple(box)
+            )
+            for (_, text, confidence), box in zip(detections, boxes)
+        ]
 
     def is_available(self) -> bool:
         try:
@@ -109,14 +363,241 @@ class EasyOCRBackend(OCRBackend):
             return False
 
 
+class ONNXOCRBackend(OCRBackend):
+    """
+    ONNX Runtime backend running EasyOCR's models without PyTorch.
+
+    Uses the CRAFT detector and CRNN recognizer exported once from
+    EasyOCR to ONNX. model_dir must contain craft.onnx, crnn.onnx and
+    crnn_charset.txt (the recognizer's character list on one line);
+    create them with `python -m tws_automation.screen.export_onnx`.
+    Runs on OpenVINO when available, else on the default CPU provider.
+    """
+
+    DEFAULT_MODEL_DIR = Path.home() / '.EasyOCR' / 'onnx'
+    DETECTOR_FILE = 'craft.onnx'
+    RECOGNIZER_FILE = 'crnn.onnx'
+    CHARSET_FILE = 'crnn_charset.txt'
+    PROVIDERS = ('OpenVINOExecutionProvider', 'CPUExecutionProvider')
+
+    # CRAFT post-processing (EasyOCR defaults)
+    CANVAS_SIZE = 2560
+    TEXT_THRESHOLD = 0.7
+    LINK_THRESHOLD = 0.4
+    LOW_TEXT = 0.4
+    MIN_COMPONENT_SIZE = 10
+    MEAN = (0.485, 0.456, 0.406)
+    STD = (0.229, 0.224, 0.225)
+
+    # CRNN input height
+    RECOGNIZER_HEIGHT = 64
+
+    def __init__(self, model_dir: Optional[str] = None):
+        self.model_dir = Path(model_dir) if model_dir else self.DEFAULT_MODEL_DIR
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> tuple:
+        """Lazy initialization of (detector, recognizer, charset)."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import onnxruntime as ort
+
+                    available = set(ort.get_available_providers())
+                    providers = [p for p in self.PROVIDERS if p in available]
+                    logger.info(f"Loading ONNX OCR models with providers: {providers}")
+
+                    detector = ort.InferenceSession(
+                        str(self.model_dir / self.DETECTOR_FILE),
+                        providers=providers
+                    )
+                    recognizer = ort.InferenceSession(
+                        str(self.model_dir / self.RECOGNIZER_FILE),
+                        providers=providers
+                    )
+                    charset = (self.model_dir / self.CHARSET_FILE).read_text(
+                        encoding='utf-8'
+                    ).rstrip('\n')
+                    self._session = (detector, recognizer, charset)
+        return self._session
+
+    def read(
+        self,
+        image: 'Image',
+        allowlist: Optional[str] = None
+    ) -> List[OCRResult]:
+        import numpy as np
+        import cv2
+
+        detector, recognizer, charset = self.session
+
+        rgb = np.asarray(image)
+        if rgb.ndim == 2:
+            rgb = cv2.cvtColor(rgb, cv2.COLOR_GRAY2RGB)
+        elif rgb.shape[2] == 4:
+            rgb = np.ascontiguousarray(rgb[:, :, :3])
+
+        boxes = self._detect(detector, rgb)
+        if not boxes:
+            return []
+
+        gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+        texts = self._recognize(recognizer, charset, gray, boxes, allowlist)
+
+        return [
+            OCRResult(text=text, confidence=confidence, bbox=box)
+            for box, (text, confidence) in zip(boxes, texts)
+            if text
+        ]
+
+    def _detect(self, detector, rgb: 'np.ndarray') -> List[Tuple[int, int, int, int]]:
+        """Find text boxes (x, y, width, height) with the CRAFT detector."""
+        import numpy as np
+        import cv2
+
+        height, width = rgb.shape[:2]
+
+        # Fit longer side into canvas, pad to a multiple of 32
+        ratio = min(1.0, self.CANVAS_SIZE / max(height, width))
+        new_h, new_w = int(height * ratio), int(width * ratio)
+        resized = cv2.resize(rgb, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+        canvas = np.zeros(
+            (1, 3, (new_h + 31) // 32 * 32, (new_w + 31) // 32 * 32),
+            dtype=np.float32
+        )
+        normalized = (resized.astype(np.float32) / 255.0 - self.MEAN) / self.STD
+        canvas[0, :, :new_h, :new_w] = normalized.transpose(2, 0, 1)
+
+        input_name = detector.get_inputs()[0].name
+        scores = detector.run(None, {input_name: canvas})[0][0]
+        score_text = scores[:, :, 0]
+        score_link = scores[:, :, 1]
+
+        # Characters joined by links form one word component
+        mask = (score_text > self.LOW_TEXT) | (score_link > self.LINK_THRESHOLD)
+        count, labels, stats, _ = cv2.connectedComponentsWithStats(
+            mask.astype(np.uint8), connectivity=4
+        )
+
+        # Score maps are half the input resolution
+        scale = 2.0 / ratio
+        boxes = []
+
+        for k in range(1, count):
+            x, y, w, h, size = stats[k]
+            if size < self.MIN_COMPONENT_SIZE:
+                continue
+
+            window = labels[y:y + h, x:x + w] == k
+            if score_text[y:y + h, x:x + w][window].max() < self.TEXT_THRESHOLD:
+                continue
+
+            # Grow box around glyph cores like CRAFT's dilation step
+            pad = int(np.sqrt(size * min(w, h) / (w * h)) * 2)
+            x0 = max(0, int((x - pad) * scale))
+            y0 = max(0, int((y - pad) * scale))
+            x1 = min(width, int((x + w + pad) * scale))
+            y1 = min(height, int((y + h + pad) * scale))
+
+            if x1 > x0 and y1 > y0:
+                boxes.append((x0, y0, x1 - x0, y1 - y0))
+
+        return boxes
+
+    def _recognize(
+        self,
+        recognizer,
+        charset: str,
+        gray: 'np.ndarray',
+        boxes: List[Tuple[int, int, int, int]],
+        allowlist: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """Read (text, confidence) for each box with the CRNN recognizer."""
+        import numpy as np
+        import cv2
+
+        target_h = self.RECOGNIZER_HEIGHT
+
+        # Resize crops to common height, keeping aspect ratio
+        crops = []
+        for x, y, w, h in boxes:
+            new_w = max(1, int(np.ceil(w * target_h / h)))
+            crops.append(cv2.resize(
+                gray[y:y + h, x:x + w], (new_w, target_h),
+                interpolation=cv2.INTER_CUBIC
+            ))
+
+        # Pad to widest crop by repeating the last column
+        max_w = max(crop.shape[1] for crop in crops)
+        batch = np.empty((len(crops), 1, target_h, max_w), dtype=np.float32)
+        for i, crop in enumerate(crops):
+            w = crop.shape[1]
+            batch[i, 0, :, :w] = crop / 127.5 - 1.0
+            batch[i, 0, :, w:] = batch[i, 0, :, w - 1:w]
+
+        input_name = recognizer.get_inputs()[0].name
+        logits = recognizer.run(None, {input_name: batch})[0]
+
+        if allowlist:
+            # Keep blank (index 0) and allowed characters only
+            allowed = np.zeros(logits.shape[2], dtype=bool)
+            allowed[0] = True
+            for char in set(allowlist) & set(charset):
+                allowed[charset.index(char) + 1] = True
+            logits[:, :, ~allowed] = -np.inf
+
+        # Softmax over characters, greedy CTC decoding
+        logits = logits - logits.max(axis=2, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=2, keepdims=True)
+        best = probs.argmax(axis=2)
+        best_prob = probs.max(axis=2)
+
+        texts = []
+        for indices, prob in zip(best, best_prob):
+            # Drop blanks (index 0) and repeated characters
+            keep = indices != 0
+            keep[1:] &= indices[1:] != indices[:-1]
+            if not keep.any():
+                texts.append(('', 0.0))
+                continue
+
+            text = ''.join(charset[i - 1] for i in indices[keep])
+            kept = prob[keep]
+            # EasyOCR's confidence: product of probabilities, length-normalized
+            confidence = float(kept.prod() ** (2.0 / np.sqrt(len(kept))))
+            texts.append((text, confidence))
+
+        return texts
+
+    def is_available(self) -> bool:
+        try:
+            import onnxruntime
+        except ImportError:
+            return False
+        return all(
+            (self.model_dir / name).exists()
+            for name in (self.DETECTOR_FILE, self.RECOGNIZER_FILE, self.CHARSET_FILE)
+        )
+
+
 class TesseractBackend(OCRBackend):
     """Tesseract OCR backend implementation."""
 
-    def read(self, image: 'Image') -> List[OCRResult]:
+    def read(
+        self,
+        image: 'Image',
+        allowlist: Optional[str] = None
+    ) -> List[OCRResult]:
         import pytesseract
 
+        config = f'-c tessedit_char_whitelist={allowlist}' if allowlist else ''
         data = pytesseract.image_to_data(
             image,
+            config=config,
             output_type=pytesseract.Output.DICT
         )
 
@@ -151,7 +632,8 @@ class OCREngine:
     """
     OCR engine optimized for trading applications.
 
-    Uses EasyOCR as primary backend with Tesseract fallback.
+    Uses EasyOCR (or its ONNX export) as primary backend
+    with Tesseract fallback.
     Provides specialized methods for reading financial data.
 
     Attributes:
@@ -160,17 +642,20 @@ class OCREngine:
     """
 
     # Patterns for financial data
-    PRICE_PATTERN = re.compile(r'\d+\.?\d*')
-    SYMBOL_PATTERN = re.compile(r'^[A-Z]{1,5}$')
-    PERCENT_PATTERN = re.compile(r'[+-]?\d+\.?\d*%')
-    QUANTITY_PATTERN = re.compile(r'^\d+$')
+    PRICE_PATTERN = _PRICE_RE
+    SYMBOL_PATTERN = _SYMBOL_RE
+    PERCENT_PATTERN = _PERCENT_RE
+    QUANTITY_PATTERN = _QUANTITY_RE
 
     def __init__(
         self,
         languages: List[str] = None,
         use_gpu: bool = True,
         confidence_threshold: float = 0.5,
-        backend: str = 'easyocr'
+        backend: str = 'easyocr',
+        cache_size: int = 256,
+        frame_skip_threshold: int = 0,
+        model_path: Optional[str] = None
     ):
         """
         Initialize OCR engine.
@@ -179,69 +664,189 @@ class OCREngine:
             languages: Languages to recognize (default: ['en']).
             use_gpu: Use GPU acceleration if available.
             confidence_threshold: Minimum confidence threshold.
-            backend: OCR backend ('easyocr' or 'tesseract').
+            backend: OCR backend ('easyocr', 'onnx' or 'tesseract').
+            cache_size: Number of images whose results are cached
+                       (0 disables the cache).
+            frame_skip_threshold: Max consecutive read_region() calls
+                       that reuse the previous results while the region
+                       looks unchanged (0 disables the motion gate).
+            model_path: Directory with exported models for the
+                       'onnx' backend.
         """
         self.languages = languages or ['en']
         self.use_gpu = use_gpu
         self.confidence_threshold = confidence_threshold
 
+        # LRU cache of backend results: image key -> List[OCRResult]
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Motion gate state: region -> (thumbnail, results, skipped frames)
+        self.frame_skip_threshold = frame_skip_threshold
+        self._region_cache: Dict[tuple, tuple] = {}
+
+        # Worker threads for read_regions(), created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
         # Initialize backend
         if backend == 'easyocr':
             self._backend = EasyOCRBackend(self.languages, use_gpu)
+        elif backend == 'onnx':
+            self._backend = ONNXOCRBackend(model_path)
         else:
             self._backend = TesseractBackend()
 
         # Fallback backend
-        self._fallback = TesseractBackend() if backend == 'easyocr' else None
+        self._fallback = TesseractBackend() if backend != 'tesseract' else None
 
     def read_text(
         self,
         image: 'Image',
-        detail: bool = True
+        detail: bool = True,
+        allowlist: Optional[str] = None
     ) -> List[OCRResult]:
         """
         Extract all text from image.
 
         Args:
-            image: PIL Image to process.
+            image: PIL Image or RGB numpy array to process.
             detail: If True, return OCRResult with positions.
                    If False, return just text strings.
+            allowlist: Only recognize these characters (faster and
+                   fewer misreads when the field's charset is known).
 
         Returns:
             List of OCRResult objects.
         """
+        key = None
+        if self.cache_size > 0:
+            key = self._cache_key(image) + (allowlist,)
+        if key is not None:
+            with self._cache_lock:
+                results = self._cache.get(key)
+                if results is not None:
+                    self._cache.move_to_end(key)
+            if results is not None:
+                return self._filter(results)
+
         try:
-            results = self._backend.read(image)
+            results = self._backend.read(image, allowlist)
         except Exception as e:
             logger.warning(f"Primary OCR failed: {e}")
             if self._fallback and self._fallback.is_available():
-                results = self._fallback.read(image)
+                results = self._fallback.read(image, allowlist)
             else:
                 return []
 
-        # Filter by confidence
-        results = [r for r in results if r.confidence >= self.confidence_threshold]
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = results
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return self._filter(results)
+
+    def clear_cache(self) -> None:
+        """Drop all cached OCR results."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _cache_key(image) -> tuple:
+        """Build cache key from image pixels, size and mode."""
+        if hasattr(image, 'tobytes') and hasattr(image, 'mode'):
+            # PIL Image
+            data = image.tobytes()
+            meta = (image.size, image.mode)
+        else:
+            import numpy as np
+            image = np.ascontiguousarray(image)
+            data = image.data
+            meta = (image.shape, image.dtype.str)
 
-        return results
+        return (hashlib.blake2b(data, digest_size=16).digest(),) + meta
+
+    def _filter(self, results: List[OCRResult]) -> List[OCRResult]:
+        """
+        Filter results by confidence.
+
+        Returns copies, so callers may adjust them without
+        touching cached results.
+        """
+        return [
+            replace(r) for r in results
+            if r.confidence >= self.confidence_threshold
+        ]
+
+    def read_text_batch(self, images: List['Image']) -> List[List[OCRResult]]:
+        """
+        Extract all text from several images at once.
+
+        Batches inference when the backend supports it, which is
+        much faster than separate read_text() calls on GPU.
+
+        Args:
+            images: PIL Images or RGB numpy arrays to process.
+
+        Returns:
+            One list of OCRResult objects per input image.
+        """
+        try:
+            batch = self._backend.read_batch(images)
+        except Exception as e:
+            logger.warning(f"Batched OCR failed: {e}")
+            return [self.read_text(image) for image in images]
+
+        # Filter by confidence
+        return [
+            [r for r in results if r.confidence >= self.confidence_threshold]
+            for results in batch
+        ]
 
     def read_region(
         self,
         image: 'Image',
-        region: Tuple[int, int, int, int]
+        region: Tuple[int, int, int, int],
+        allowlist: Optional[str] = None
     ) -> List[OCRResult]:
         """
         Extract text from specific image region.
 
+        With frame_skip_threshold set, a region that looks unchanged
+        since its last read reuses those results, up to that many
+        times in a row. Small changes (a single digit in a large
+        table) may go unnoticed until the next full read.
+
         Args:
-            image: PIL Image.
+            image: PIL Image or RGB numpy array.
             region: Region (x, y, width, height).
+            allowlist: Only recognize these characters.
 
         Returns:
-            List of OCRResult objects.
+            List of OCRResult objects (empty if region lies
+            outside the image).
         """
+        pixels = self._as_array(image)
+
+        # Clip region to image bounds; slicing would misplace
+        # negative offsets instead of padding like PIL crop()
         x, y, w, h = region
-        cropped = image.crop((x, y, x + w, y + h))
-        results = self.read_text(cropped)
+        right = min(x + w, pixels.shape[1])
+        bottom = min(y + h, pixels.shape[0])
+        x = max(x, 0)
+        y = max(y, 0)
+        if right <= x or bottom <= y:
+            return []
+
+        # Crop as a view into the pixels, no copy
+        cropped = pixels[y:bottom, x:right]
+
+        if self.frame_skip_threshold > 0:
+            results = self._read_gated(cropped, (tuple(region), allowlist), allowlist)
+        else:
+            results = self.read_text(cropped, allowlist=allowlist)
 
         # Adjust coordinates to original image
         for result in results:
@@ -250,6 +855,88 @@ class OCREngine:
 
         return results
 
+    def read_regions(
+        self,
+        image: 'Image',
+        regions: List[Tuple[int, int, int, int]],
+        allowlist: Optional[str] = None
+    ) -> List[List[OCRResult]]:
+        """
+        Extract text from several regions of one image in parallel.
+
+        Regions are read on a thread pool; model inference
+        releases the GIL, so independent regions overlap.
+
+        Args:
+            image: PIL Image or RGB numpy array.
+            regions: Regions (x, y, width, height).
+            allowlist: Only recognize these characters.
+
+        Returns:
+            One list of OCRResult objects per region, in order.
+        """
+        if not regions:
+            return []
+
+        # Convert once, every region is then a view into the same pixels
+        pixels = self._as_array(image)
+
+        return list(self._get_pool().map(
+            lambda region: self.read_region(pixels, region, allowlist),
+            regions
+        ))
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get thread pool for parallel region reads."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=os.cpu_count(),
+                        thread_name_prefix='ocr'
+                    )
+        return self._pool
+
+    @staticmethod
+    def _as_array(image) -> 'np.ndarray':
+        """Get pixels of PIL Image or numpy array as numpy array."""
+        import numpy as np
+
+        if isinstance(image, np.ndarray):
+            return image
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        return np.asarray(image)
+
+    def _read_gated(
+        self,
+        cropped: 'np.ndarray',
+        key: tuple,
+        allowlist: Optional[str] = None
+    ) -> List[OCRResult]:
+        """Read cropped region unless it is unchanged since last read."""
+        import numpy as np
+        import cv2
+
+        gray = cropped
+        if gray.ndim == 3:
+            gray = cv2.cvtColor(gray, cv2.COLOR_RGB2GRAY)
+        thumb = cv2.resize(
+            gray, MOTION_THUMB_SIZE, interpolation=cv2.INTER_AREA
+        ).astype(np.int16)
+
+        cached = self._region_cache.get(key)
+        if cached is not None:
+            last_thumb, results, skipped = cached
+            if (skipped < self.frame_skip_threshold
+                    and np.abs(thumb - last_thumb).mean() < MOTION_THRESHOLD):
+                self._region_cache[key] = (last_thumb, results, skipped + 1)
+                return self._filter(results)
+
+        results = self.read_text(cropped, allowlist=allowlist)
+        self._region_cache[key] = (thumb, results, 0)
+        return self._filter(results)
+
     def find_text(
         self,
         image: 'Image',
@@ -260,7 +947,7 @@ class OCREngine:
         Find specific text in image.
 
         Args:
-            image: PIL Image.
+            image: PIL Image or RGB numpy array.
             pattern: Text or regex pattern to find.
             regex: Treat pattern as regex.
 
@@ -269,12 +956,15 @@ class OCREngine:
         """
         results = self.read_text(image)
 
-        for result in results:
-            if regex:
-                if re.search(pattern, result.text, re.IGNORECASE):
+        if regex:
+            search = _compile(pattern).search
+            for result in results:
+                if search(result.text):
                     return result
-            else:
-                if pattern.lower() in result.text.lower():
+        else:
+            needle = pattern.lower()
+            for result in results:
+                if needle in result.text.lower():
                     return result
 
         return None
@@ -297,17 +987,13 @@ class OCREngine:
             List of matching OCRResult objects.
         """
         results = self.read_text(image)
-        matches = []
 
-        for result in results:
-            if regex:
-                if re.search(pattern, result.text, re.IGNORECASE):
-                    matches.append(result)
-            else:
-                if pattern.lower() in result.text.lower():
-                    matches.append(result)
+        if regex:
+            search = _compile(pattern).search
+            return [r for r in results if search(r.text)]
 
-        return matches
+        needle = pattern.lower()
+        return [r for r in results if needle in r.text.lower()]
 
     def read_price(
         self,
@@ -325,12 +1011,18 @@ class OCREngine:
             Price as float, or None.
         """
         if region:
-            results = self.read_region(image, region)
+            results = self.read_region(image, region, PRICE_CHARS)
         else:
-            results = self.read_text(image)
+            results = self.read_text(image, allowlist=PRICE_CHARS)
 
+        search = _PRICE_RE.search
         for result in results:
-            match = self.PRICE_PATTERN.search(result.text)
+            price = _parse_price(result.text)
+            if price is not None:
+                return price
+
+            # Number embedded in other text
+            match = search(result.text)
             if match:
                 try:
                     return float(match.group())
@@ -355,13 +1047,14 @@ class OCREngine:
             Symbol string, or None.
         """
         if region:
-            results = self.read_region(image, region)
+            results = self.read_region(image, region, SYMBOL_CHARS)
         else:
-            results = self.read_text(image)
+            results = self.read_text(image, allowlist=SYMBOL_CHARS)
 
+        match = _SYMBOL_RE.match
         for result in results:
             text = result.text.strip().upper()
-            if self.SYMBOL_PATTERN.match(text):
+            if match(text):
                 return text
 
         return None
@@ -381,34 +1074,34 @@ class OCREngine:
         Returns:
             List of row dictionaries.
         """
+        import numpy as np
+
         results = self.read_text(image)
 
         if not results:
             return []
 
-        # Sort by Y coordinate to group rows
-        results.sort(key=lambda r: r.bbox[1])
-
-        rows = []
-        current_row = []
-        last_y = -1
         row_threshold = 20  # Pixels
 
-        for result in results:
-            y = result.bbox[1]
-            if last_y < 0 or abs(y - last_y) < row_threshold:
-                current_row.append(result)
-            else:
-                if current_row:
-                    # Sort row by X coordinate
-                    current_row.sort(key=lambda r: r.bbox[0])
-                    rows.append([r.text for r in current_row])
-                current_row = [result]
-            last_y = y
-
-        if current_row:
-            current_row.sort(key=lambda r: r.bbox[0])
-            rows.append([r.text for r in current_row])
+        # Box positions as arrays (one entry per result)
+        count = len(results)
+        xs = np.fromiter((r.bbox[0] for r in results), dtype=np.int64, count=count)
+        ys = np.fromiter((r.bbox[1] for r in results), dtype=np.int64, count=count)
+
+        # Sort by Y coordinate to group rows
+        order = np.argsort(ys, kind='stable')
+        labels = _cluster_rows(ys[order], row_threshold)
+
+        # Sort every row by X coordinate in one pass (row id is primary key)
+        order = order[np.lexsort((xs[order], labels))]
+        row_breaks = np.flatnonzero(np.diff(labels)) + 1
+
+        texts = [results[i].text for i in order.tolist()]
+        bounds = [0, *row_breaks.tolist(), count]
+        rows = [
+            texts[start:end]
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
 
         # Convert to dictionaries if columns provided
         if columns and rows:
@@ -5,24 +5,27 @@ Supports multiple resolutions with automatic scaling.
 Regions are defined relative to TWS window position.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
 from typing import Dict, Tuple, Optional, TYPE_CHECKING
 import json
 import logging
+import time
 
 if TYPE_CHECKING:
+    import numpy as np
     from ..core.window import TWSWindow
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Region:
     """
     Screen region definition.
 
     Represents a rectangular area of the screen,
     typically containing a UI element or group.
+    Immutable; scale() and offset() return new regions.
 
     Attributes:
         name: Unique region identifier.
@@ -69,13 +72,12 @@ class Region:
         Returns:
             New scaled Region.
         """
-        return Region(
-            name=self.name,
+        return replace(
+            self,
             x=int(self.x * factor),
             y=int(self.y * factor),
             width=int(self.width * factor),
-            height=int(self.height * factor),
-            description=self.description
+            height=int(self.height * factor)
         )
 
     def offset(self, dx: int, dy: int) -> 'Region':
@@ -89,20 +91,40 @@ class Region:
         Returns:
             New offset Region.
         """
-        return Region(
-            name=self.name,
-            x=self.x + dx,
-            y=self.y + dy,
-            width=self.width,
-            height=self.height,
-            description=self.description
-        )
+        return replace(self, x=self.x + dx, y=self.y + dy)
 
     def contains(self, x: int, y: int) -> bool:
         """Check if point is inside region."""
+        # All four comparisons are evaluated (no short-circuit branches)
         return (
-            self.x <= x < self.x + self.width and
-            self.y <= y < self.y + self.height
+            (self.x <= x) & (x < self.x + self.width) &
+            (self.y <= y) & (y < self.y + self.height)
+        )
+
+    @staticmethod
+    def contains_many(bounds, xs, ys) -> 'np.ndarray':
+        """
+        Hit-test many points against many regions at once.
+
+        Args:
+            bounds: Array-like (R, 4) of region bounds (x, y, width, height).
+            xs: Array-like (N,) of point X coordinates.
+            ys: Array-like (N,) of point Y coordinates.
+
+        Returns:
+            Bool numpy array (R, N); [i, j] is True if point j
+            is inside region i.
+        """
+        import numpy as np
+
+        bounds = np.asarray(bounds).reshape(-1, 4)
+        xs = np.asarray(xs)[None, :]
+        ys = np.asarray(ys)[None, :]
+
+        rx, ry, rw, rh = (bounds[:, i:i + 1] for i in range(4))
+        return (
+            (xs >= rx) & (xs < rx + rw) &
+            (ys >= ry) & (ys < ry + rh)
         )
 
     def to_dict(self) -> dict:
@@ -132,10 +154,14 @@ class RegionManager:
     Attributes:
         BASE_RESOLUTION: Reference resolution for region definitions.
         PREDEFINED_REGIONS: Default region definitions.
+        WINDOW_OFFSET_TTL: Seconds a queried window position is reused.
     """
 
     BASE_RESOLUTION = (1920, 1080)
 
+    # About one frame at 30 FPS
+    WINDOW_OFFSET_TTL = 0.033
+
     # Predefined regions (relative to window, may need calibration)
     PREDEFINED_REGIONS = {
         'symbol_input': Region(
@@ -200,9 +226,16 @@ class RegionManager:
         self.scale_factor = 1.0
         self.window_offset = (0, 0)
 
+        # (monotonic timestamp, offset) of last window rect query
+        self._offset_cache: Optional[Tuple[float, Tuple[int, int]]] = None
+
         # Copy predefined regions
         self.regions: Dict[str, Region] = dict(self.PREDEFINED_REGIONS)
 
+        # Region bounds as (N, 4) array + name -> row, built on demand
+        self._region_xywh: Optional['np.ndarray'] = None
+        self._region_index: Dict[str, int] = {}
+
         if config_path:
             self.load_config(config_path)
 
@@ -232,14 +265,57 @@ class RegionManager:
 
         return region
 
+    def get_all_absolute(self) -> Tuple['np.ndarray', Dict[str, int]]:
+        """
+        Get bounds of all regions at once.
+
+        Scale and window offset are applied to every region with
+        one numpy operation instead of a Region per get() call.
+
+        Returns:
+            Tuple of int32 array (N, 4) of (x, y, width, height)
+            rows and dict mapping region name to row index.
+        """
+        import numpy as np
+
+        if self._region_xywh is None:
+            self._region_index = {name: i for i, name in enumerate(self.regions)}
+            self._region_xywh = np.array(
+                [region.bounds for region in self.regions.values()],
+                dtype=np.int32
+            ).reshape(-1, 4)
+
+        bounds = self._region_xywh
+        if self.scale_factor != 1.0:
+            bounds = (bounds * self.scale_factor).astype(np.int32)
+
+        dx, dy = self._get_window_offset()
+        return bounds + np.array([dx, dy, 0, 0], dtype=np.int32), self._region_index
+
     def _get_window_offset(self) -> Tuple[int, int]:
-        """Get window top-left offset."""
+        """
+        Get window top-left offset.
+
+        The window position is queried at most once per
+        WINDOW_OFFSET_TTL seconds.
+        """
         if self.window:
+            now = time.monotonic()
+            cached = self._offset_cache
+            if cached is not None and now - cached[0] < self.WINDOW_OFFSET_TTL:
+                return cached[1]
+
             rect = self.window.get_window_rect()
             if rect:
-                return (rect[0], rect[1])
+                offset = (rect[0], rect[1])
+                self._offset_cache = (now, offset)
+                return offset
         return self.window_offset
 
+    def invalidate_window_offset(self) -> None:
+        """Forget cached window position (call after moving the window)."""
+        self._offset_cache = None
+
     def define(self, name: str, region: Region) -> None:
         """
         Define or update a region.
@@ -249,6 +325,7 @@ class RegionManager:
             region: Region definition.
         """
         self.regions[name] = region
+        self._region_xywh = None
         logger.debug(f"Defined region: {name}")
 
     def remove(self, name: str) -> bool:
@@ -263,6 +340,7 @@ class RegionManager:
         """
         if name in self.regions:
             del self.regions[name]
+            self._region_xywh = None
             return True
         return False
 
@@ -334,6 +412,7 @@ class RegionManager:
             if 'regions' in config:
                 for name, data in config['regions'].items():
                     self.regions[name] = Region.from_dict(data)
+                self._region_xywh = None
 
             logger.info(f"Loaded region config from {path}")
 
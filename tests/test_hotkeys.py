@@ -164,6 +164,30 @@ def test_special_keys() -> bool:
     return True
 
 
+def test_key_mappings_frozen() -> bool:
+    """Test that key mappings are shared read-only module-level tables."""
+    from tws_automation.input import keyboard as keyboard_module
+    from tws_automation.input.keyboard import Keyboard
+
+    kb = Keyboard()
+
+    assert kb.VK_CODES is keyboard_module._VK_CODES, "VK_CODES should alias module table"
+    assert kb.SPECIAL_KEYS is keyboard_module._SPECIAL_KEYS, "SPECIAL_KEYS should alias module table"
+
+    try:
+        kb.VK_CODES['ctrl'] = 0
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("VK_CODES should be read-only")
+
+    for mod in ('ctrl', 'alt', 'shift', 'win'):
+        assert mod in keyboard_module._MOD_SET, f"'{mod}' missing from _MOD_SET"
+        assert mod in kb.VK_CODES, f"'{mod}' missing from VK_CODES"
+
+    return True
+
+
 def test_tws_hotkeys_default_bindings() -> bool:
     """Test TWSHotkeys default bindings."""
     from tws_automation.input.keyboard import Keyboard
@@ -210,6 +234,32 @@ def test_hotkey_binding_to_sequence() -> bool:
     return True
 
 
+def test_clipboard_open_retry() -> bool:
+    """Test clipboard open retries while busy and gives up after a bound."""
+    from tws_automation.input import keyboard as keyboard_module
+
+    class FakeClipboard:
+        def __init__(self, busy_for):
+            self.busy_for = busy_for
+            self.calls = 0
+
+        def OpenClipboard(self):
+            self.calls += 1
+            if self.calls <= self.busy_for:
+                raise OSError("Access is denied")
+
+    clipboard = FakeClipboard(busy_for=3)
+    assert keyboard_module._open_clipboard(clipboard), "Should open once released"
+    assert clipboard.calls == 4, f"Expected 4 attempts, got {clipboard.calls}"
+
+    clipboard = FakeClipboard(busy_for=1000)
+    assert not keyboard_module._open_clipboard(clipboard), "Should give up while busy"
+    assert clipboard.calls == keyboard_module.CLIPBOARD_OPEN_ATTEMPTS, \
+        f"Expected {keyboard_module.CLIPBOARD_OPEN_ATTEMPTS} attempts, got {clipboard.calls}"
+
+    return True
+
+
 # =============================================================================
 # Part 2: Integration Tests (TWS required)
 # =============================================================================
@@ -379,8 +429,10 @@ def run_basic_tests() -> Tuple[int, int]:
         ("Keyboard initialization", test_keyboard_init),
         ("Hotkey format (^+b)", test_hotkey_format),
         ("Special keys mapping", test_special_keys),
+        ("Key mappings read-only", test_key_mappings_frozen),
         ("TWS hotkey default bindings", test_tws_hotkeys_default_bindings),
         ("HotkeyBinding.to_sequence()", test_hotkey_binding_to_sequence),
+        ("Clipboard open retry", test_clipboard_open_retry),
     ]
 
     passed = 0
@@ -0,0 +1,437 @@
+"""
+Tests for screen capture and OCR helpers.
+
+Covers the pure image-processing code paths, no TWS or display required.
+
+Usage:
+    python -m tests.test_screen
+"""
+
+import sys
+from typing import Tuple
+
+from .test_hotkeys import Colors, print_header, run_test
+
+
+# =============================================================================
+# Capture
+# =============================================================================
+
+def test_sad_kernel_matches_numpy() -> bool:
+    """Test Numba SAD kernel against numpy, including a < b."""
+    import numpy as np
+    from tws_automation.screen.capture import _get_sad_kernel
+
+    kernel = _get_sad_kernel()
+    if kernel is None:
+        print(f"      {Colors.YELLOW}numba not installed, skipped{Colors.RESET}")
+        return True
+
+    def expected(a, b):
+        return int(np.abs(a.astype(int) - b.astype(int)).sum())
+
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 256, (50, 180), dtype=np.uint8)
+    b = rng.integers(0, 256, (50, 180), dtype=np.uint8)
+    high = np.full((4, 4), 200, dtype=np.uint8)
+    low = np.full((4, 4), 10, dtype=np.uint8)
+
+    for x, y in [(a, b), (b, a), (high, low), (low, high)]:
+        if kernel(x, y) != expected(x, y):
+            return False
+    return True
+
+
+def test_compare_images_matches_reference() -> bool:
+    """Test compare_images() against the numpy SAD reference, incl. mode '1'."""
+    import numpy as np
+    from PIL import Image
+    from tws_automation.screen.capture import ScreenCapture
+
+    capture = ScreenCapture()
+    rng = np.random.default_rng(3)
+
+    def pair(mode):
+        first = Image.fromarray(rng.integers(0, 256, (32, 48, 3), dtype=np.uint8))
+        second = Image.fromarray(rng.integers(0, 256, (32, 48, 3), dtype=np.uint8))
+        return first.convert(mode), second.convert(mode)
+
+    cases = [pair(mode) for mode in ('1', 'L', 'RGB', 'I', 'F')]
+    first, second = pair('L')
+    cases.append((first, second.convert('1')))  # same shape, mixed dtypes
+
+    for image1, image2 in cases:
+        arr1 = np.asarray(image1).astype(float)
+        arr2 = np.asarray(image2).astype(float)
+        similarity = 1.0 - np.abs(arr1 - arr2).sum() / (255.0 * arr1.size)
+
+        if not capture.compare_images(image1, image2, threshold=similarity - 1e-9):
+            return False
+        if capture.compare_images(image1, image2, threshold=similarity + 1e-9):
+            return False
+    return True
+
+
+def test_phash_not_inherited() -> bool:
+    """Test that derived images do not reuse the parent's cached pHash."""
+    import numpy as np
+    from PIL import Image
+    from tws_automation.screen.capture import ScreenCapture, _phash
+
+    rng = np.random.default_rng(1)
+    image = Image.fromarray(rng.integers(0, 256, (64, 128, 3), dtype=np.uint8))
+    _phash(image)
+
+    left = image.crop((0, 0, 64, 64))
+    right = image.crop((64, 0, 128, 64))
+    if _phash(left) == _phash(right):
+        return False
+
+    copy = Image.fromarray(np.array(left))
+    capture = ScreenCapture()
+    return capture.compare_images(left, copy, max_hash_distance=0)
+
+
+def test_close_releases_all_mss_instances() -> bool:
+    """Test that close() closes mss instances created on other threads."""
+    import threading
+    import types
+    from tws_automation.screen import capture
+
+    created = []
+
+    class FakeMSS:
+        def __init__(self):
+            self.closed = False
+            created.append(self)
+
+        def close(self):
+            self.closed = True
+
+    original = capture.mss
+    capture.mss = types.SimpleNamespace(mss=FakeMSS)
+    try:
+        screen = capture.ScreenCapture()
+        workers = [threading.Thread(target=screen._get_sct) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        screen._get_sct()
+
+        screen.close()
+        if len(created) != 4 or not all(sct.closed for sct in created):
+            return False
+
+        # Closed instances are replaced on next use
+        return not screen._get_sct().closed
+    finally:
+        capture.mss = original
+
+
+def test_from_numpy_dtypes() -> bool:
+    """Test from_numpy() on BGR uint8 and grayscale/non-uint8 arrays."""
+    import numpy as np
+    from tws_automation.screen.capture import ScreenCapture
+
+    capture = ScreenCapture()
+
+    bgr = np.zeros((4, 6, 3), dtype=np.uint8)
+    bgr[..., 0] = 255  # blue
+    if capture.from_numpy(bgr).getpixel((0, 0)) != (0, 0, 255):
+        return False
+
+    for array, mode in [
+        (np.zeros((4, 6), dtype=np.uint8), 'L'),
+        (np.zeros((4, 6), dtype=np.float32), 'F'),
+        (np.zeros((4, 6), dtype=np.int32), 'I'),
+        (np.zeros((4, 6), dtype=bool), '1'),
+        (np.zeros((4, 6, 4), dtype=np.uint8), 'RGBA'),
+    ]:
+        if capture.from_numpy(array).mode != mode:
+            return False
+    return True
+
+
+# =============================================================================
+# OCR
+# =============================================================================
+
+def _make_engine(**kwargs):
+    """OCREngine whose backend records image shapes and finds one word."""
+    from tws_automation.screen.ocr import OCREngine, OCRBackend, OCRResult
+
+    class FakeBackend(OCRBackend):
+        def __init__(self):
+            self.shapes = []
+
+        def read(self, image, allowlist=None):
+            self.shapes.append(image.shape)
+            return [OCRResult(text='X', confidence=1.0, bbox=(1, 2, 5, 5))]
+
+        def is_available(self):
+            return True
+
+    engine = OCREngine(backend='tesseract', cache_size=0, **kwargs)
+    engine._backend = FakeBackend()
+    return engine
+
+
+def test_read_region_out_of_bounds() -> bool:
+    """Test regions partly or fully outside the image are clipped."""
+    import numpy as np
+
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    engine = _make_engine()
+
+    # Left edge: reads the left 40 columns, boxes relative to x=0
+    results = engine.read_region(image, (-10, 0, 50, 50))
+    if engine._backend.shapes[-1] != (50, 40, 3) or results[0].bbox != (1, 2, 5, 5):
+        return False
+
+    # Bottom-right corner
+    results = engine.read_region(image, (90, 80, 20, 40))
+    if engine._backend.shapes[-1] != (20, 10, 3) or results[0].bbox != (91, 82, 5, 5):
+        return False
+
+    # No overlap: nothing read, also with the motion gate enabled
+    gated = _make_engine(frame_skip_threshold=2)
+    for ocr in (engine, gated):
+        calls = len(ocr._backend.shapes)
+        if ocr.read_region(image, (150, 0, 20, 20)) != []:
+            return False
+        if ocr.read_region(image, (-30, -30, 20, 20)) != []:
+            return False
+        if len(ocr._backend.shapes) != calls:
+            return False
+    return True
+
+
+def test_easyocr_warmup_reads_text() -> bool:
+    """Test reader loads once and warms up on an image with text."""
+    import sys
+    import types
+    import numpy as np
+    from tws_automation.screen.ocr import EasyOCRBackend
+
+    reads = []
+
+    class FakeReader:
+        def __init__(self, languages, gpu):
+            self.gpu = gpu
+
+        def readtext(self, image, **kwargs):
+            reads.append(image)
+            return []
+
+    original = sys.modules.get('easyocr')
+    sys.modules['easyocr'] = types.SimpleNamespace(Reader=FakeReader)
+    try:
+        backend = EasyOCRBackend(['en'], use_gpu=False)
+        first = backend.reader
+        if backend.reader is not first or len(reads) != 1:
+            return False
+    finally:
+        if original is None:
+            del sys.modules['easyocr']
+        else:
+            sys.modules['easyocr'] = original
+
+    # Dark glyphs on a light background, not a blank frame
+    dark = (reads[0] < 128).any(axis=2)
+    return first.gpu is False and 0.01 < dark.mean() < 0.5
+
+
+class _FakeTensor:
+    """Minimal torch.Tensor stand-in backed by a numpy array."""
+
+    def __init__(self, array):
+        self.array = array
+
+    def is_floating_point(self):
+        return self.array.dtype.kind == 'f'
+
+    def half(self):
+        import numpy as np
+        return _FakeTensor(self.array.astype(np.float16))
+
+    def float(self):
+        import numpy as np
+        return _FakeTensor(self.array.astype(np.float32))
+
+
+def test_fp16_outputs_post_process() -> bool:
+    """Test FP16 detector output is cast back before cv2 post-processing."""
+    import numpy as np
+    import cv2
+    from tws_automation.screen.ocr import _half_inputs, _float_outputs
+
+    batch = _FakeTensor(np.zeros((1, 3, 8, 8), dtype=np.float32))
+    image, text = _half_inputs(None, (batch, None))
+    if image.array.dtype != np.float16 or text is not None:
+        return False
+
+    # CRAFT returns (score maps, features); EasyOCR thresholds the maps
+    scores = np.random.default_rng(2).random((1, 16, 16, 2)).astype(np.float16)
+    output = (_FakeTensor(scores), _FakeTensor(scores.copy()))
+    try:
+        cv2.threshold(scores[0, :, :, 0], 0.4, 1, 0)
+        return False  # float16 maps must be rejected, or this test is moot
+    except cv2.error:
+        pass
+
+    y, feature = _float_outputs(None, (), output)
+    text_map = y.array[0, :, :, 0]
+    _, binary = cv2.threshold(text_map, 0.4, 1, 0)
+    return (feature.array.dtype == np.float32
+            and np.array_equal(binary, (text_map > 0.4).astype(np.float32)))
+
+
+class _FakeSession:
+    """Stand-in for onnxruntime.InferenceSession."""
+
+    def __init__(self, run):
+        self._run = run
+        self.inputs = []
+
+    def get_inputs(self):
+        from types import SimpleNamespace
+        return [SimpleNamespace(name='image')]
+
+    def run(self, output_names, feed):
+        self.inputs.append(feed['image'])
+        return [self._run(feed['image'])]
+
+
+def _fake_detector():
+    """CRAFT stand-in: one word, one speck and one weak blob."""
+    import numpy as np
+
+    def run(canvas):
+        _, _, height, width = canvas.shape
+        scores = np.zeros((1, height // 2, width // 2, 2), dtype=np.float32)
+        scores[0, 10:20, 20:60, 0] = 0.9   # word
+        scores[0, 40:42, 10:12, 0] = 0.9   # too small
+        scores[0, 40:50, 80:100, 0] = 0.5  # below text threshold
+        return scores
+
+    return _FakeSession(run)
+
+
+def test_onnx_detect() -> bool:
+    """Test ONNX backend CRAFT post-processing with a fake detector."""
+    import numpy as np
+    from tws_automation.screen.ocr import ONNXOCRBackend
+
+    backend = ONNXOCRBackend()
+    detector = _fake_detector()
+    boxes = backend._detect(detector, np.zeros((100, 200, 3), dtype=np.uint8))
+
+    # Canvas padded to multiples of 32; box grown by the dilation pad
+    # (6 score pixels) and scaled from the half-resolution score map
+    return (detector.inputs[0].shape == (1, 3, 128, 224)
+            and boxes == [(28, 8, 104, 44)])
+
+
+def test_onnx_recognize() -> bool:
+    """Test ONNX backend CTC decoding and allowlist masking."""
+    import numpy as np
+    from tws_automation.screen.ocr import ONNXOCRBackend
+
+    # Classes: blank, 'a', 'b', 'c'
+    steps = np.array([
+        [0, 5, 4, 0],
+        [0, 5, 4, 0],
+        [5, 0, 0, 0],
+        [3, 5, 1, 0],
+        [0, 0, 5, 0],
+        [5, 0, 0, 0],
+    ], dtype=np.float32)
+    blank = np.tile([5, 0, 0, 0], (6, 1)).astype(np.float32)
+
+    recognizer = _FakeSession(lambda batch: np.stack([steps, blank])[:len(batch)].copy())
+    backend = ONNXOCRBackend()
+    gray = np.zeros((100, 200), dtype=np.uint8)
+    boxes = [(0, 0, 50, 20), (50, 0, 100, 32)]
+
+    texts = backend._recognize(recognizer, 'abc', gray, boxes)
+    if recognizer.inputs[0].shape != (2, 1, 64, 200):
+        return False
+    if [text for text, _ in texts] != ['aab', ''] or texts[1][1] != 0.0:
+        return False
+    if not 0.0 < texts[0][1] <= 1.0:
+        return False
+
+    # 'a' masked out: its steps fall back to 'b' or blank
+    texts = backend._recognize(recognizer, 'abc', gray, boxes, allowlist='b')
+    return [text for text, _ in texts] == ['bb', '']
+
+
+def test_onnx_read() -> bool:
+    """Test ONNX backend read() end to end with fake sessions."""
+    import numpy as np
+    from tws_automation.screen.ocr import ONNXOCRBackend
+
+    logits = np.array([[[0, 0, 5, 0], [5, 0, 0, 0], [0, 0, 0, 5]]], dtype=np.float32)
+    recognizer = _FakeSession(lambda batch: np.repeat(logits, len(batch), axis=0))
+
+    backend = ONNXOCRBackend()
+    backend._session = (_fake_detector(), recognizer, 'abc')
+    results = backend.read(np.zeros((100, 200, 3), dtype=np.uint8))
+
+    return (len(results) == 1
+            and results[0].text == 'bc'
+            and results[0].bbox == (28, 8, 104, 44))
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def run_tests() -> Tuple[int, int]:
+    """Run screen tests."""
+    print_header("Screen Capture and OCR Tests")
+
+    tests = [
+        ("Numba SAD kernel matches numpy", test_sad_kernel_matches_numpy),
+        ("compare_images() matches numpy reference", test_compare_images_matches_reference),
+        ("pHash not inherited by derived images", test_phash_not_inherited),
+        ("close() releases all mss instances", test_close_releases_all_mss_instances),
+        ("from_numpy() dtypes", test_from_numpy_dtypes),
+        ("OCR read_region out of bounds", test_read_region_out_of_bounds),
+        ("EasyOCR warmup reads text", test_easyocr_warmup_reads_text),
+        ("EasyOCR FP16 outputs post-process", test_fp16_outputs_post_process),
+        ("ONNX backend detection", test_onnx_detect),
+        ("ONNX backend CTC decode and allowlist", test_onnx_recognize),
+        ("ONNX backend read()", test_onnx_read),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        if run_test(name, test_func):
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def main():
+    passed, failed = run_tests()
+
+    print_header("Summary")
+    print(f"  {Colors.GREEN}Passed: {passed}{Colors.RESET}")
+    print(f"  {Colors.RED}Failed: {failed}{Colors.RESET}")
+
+    if failed == 0:
+        print(f"\n  {Colors.GREEN}{Colors.BOLD}All tests passed!{Colors.RESET}")
+        sys.exit(0)
+    else:
+        print(f"\n  {Colors.RED}{Colors.BOLD}Some tests failed.{Colors.RESET}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+"""
+Tests for utility helpers (logging, validation).
+
+No TWS or display required.
+
+Usage:
+    python -m tests.test_utils
+"""
+
+import os
+import sys
+import json
+import tempfile
+from typing import Tuple
+
+from .test_hotkeys import Colors, print_header, run_test
+
+
+# =============================================================================
+# Action logging
+# =============================================================================
+
+def test_action_log_non_plain_values() -> bool:
+    """Test that numpy params and int dict keys reach log file and export."""
+    import numpy as np
+    from tws_automation.utils.logging import ActionLogger
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, 'actions.jsonl')
+        export_path = os.path.join(tmp, 'export.json')
+
+        action_logger = ActionLogger(log_path)
+        params = {'price': np.float64(1.5), 'qty': np.int64(3), 'levels': {1: 'a'}}
+        action_logger.log_action('place_order', params, None, 0.1)
+        action_logger.export(export_path)
+        action_logger.close()
+
+        with open(log_path) as f:
+            lines = f.read().splitlines()
+        with open(export_path) as f:
+            exported = json.load(f)
+
+    if len(lines) != 1 or len(exported) != 1:
+        return False
+
+    for entry in (json.loads(lines[0]), exported[0]):
+        if entry['params'] != {'price': 1.5, 'qty': 3, 'levels': {'1': 'a'}}:
+            return False
+    return True
+
+
+def test_action_log_file_lifecycle() -> bool:
+    """Test concurrent writes stay whole and dropped loggers close their file."""
+    import gc
+    import threading
+    import weakref
+    from tws_automation.utils.logging import ActionLogger
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, 'actions.jsonl')
+        action_logger = ActionLogger(log_path)
+
+        def worker(n):
+            for i in range(200):
+                action_logger.log_action('click', {'worker': n, 'i': i}, None, 0.0)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        fp = action_logger._fp
+        ref = weakref.ref(action_logger)
+        del action_logger
+        gc.collect()
+
+        with open(log_path) as f:
+            lines = [json.loads(line) for line in f]
+
+    # No exit hook keeps the logger alive; collecting it closes the file
+    return ref() is None and fp.closed and len(lines) == 1600
+
+
+def test_json_fallback_matches_orjson() -> bool:
+    """Test stdlib json fallback encodes numpy values and keys like orjson."""
+    import importlib
+    import numpy as np
+    from tws_automation.utils import serialization
+
+    value = {
+        'price': np.float64(1.5),
+        'qty': np.int64(3),
+        'flag': np.bool_(True),
+        'levels': np.array([[1, 2], [3, 4]]),
+        'keys': {1: 'a', 2.5: 'b', None: 'c'},
+        'bool_keys': {False: 'd'},
+    }
+    expected = {
+        'price': 1.5,
+        'qty': 3,
+        'flag': True,
+        'levels': [[1, 2], [3, 4]],
+        'keys': {'1': 'a', '2.5': 'b', 'null': 'c'},
+        'bool_keys': {'false': 'd'},
+    }
+
+    original = sys.modules.get('orjson')
+    sys.modules['orjson'] = None  # makes "import orjson" fail
+    try:
+        fallback = importlib.reload(serialization)
+        text = fallback.dumps(value)
+    finally:
+        if original is None:
+            del sys.modules['orjson']
+        else:
+            sys.modules['orjson'] = original
+        importlib.reload(serialization)
+
+    if json.loads(text) != expected:
+        return False
+    return original is None or json.loads(serialization.dumps(value)) == expected
+
+
+# =============================================================================
+# Validation
+# =============================================================================
+
+def test_validators_reject_unhashable() -> bool:
+    """Test that non-string input raises ValidationError, not TypeError."""
+    from tws_automation.utils.validation import (
+        ValidationError,
+        validate_symbol,
+        validate_side,
+        validate_order_type,
+        validate_timeframe,
+    )
+
+    for validator, value in [
+        (validate_symbol, ['AAPL']),
+        (validate_side, ['BUY']),
+        (validate_order_type, {'type': 'LMT'}),
+        (validate_timeframe, ['1m']),
+    ]:
+        try:
+            validator(value)
+        except ValidationError:
+            pass
+        else:
+            return False
+
+    # Valid strings still normalize (and come from the cache)
+    return (validate_symbol(' aapl ') == 'AAPL'
+            and validate_side('buy') == 'BUY'
+            and validate_order_type('lmt') == 'LMT'
+            and validate_timeframe('1m') == '1m')
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def run_tests() -> Tuple[int, int]:
+    """Run utility tests."""
+    print_header("Utility Tests")
+
+    tests = [
+        ("Action log with numpy params", test_action_log_non_plain_values),
+        ("Action log file lifecycle", test_action_log_file_lifecycle),
+        ("JSON fallback matches orjson", test_json_fallback_matches_orjson),
+        ("Validators reject non-string input", test_validators_reject_unhashable),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        if run_test(name, test_func):
+            passed += 1
+        else:
+            failed += 1
+
+    return passed, failed
+
+
+def main():
+    passed, failed = run_tests()
+
+    print_header("Summary")
+    print(f"  {Colors.GREEN}Passed: {passed}{Colors.RESET}")
+    print(f"  {Colors.RED}Failed: {failed}{Colors.RESET}")
+
+    if failed == 0:
+        print(f"\n  {Colors.GREEN}{Colors.BOLD}All tests passed!{Colors.RESET}")
+        sys.exit(0)
+    else:
+        print(f"\n  {Colors.RED}{Colors.BOLD}Some tests failed.{Colors.RESET}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,7 @@ Utilities module - logging, retry, validation.
 """
 
 from .logging import setup_logging, get_logger, ActionLogger
-from .retry import retry_on_failure, wait_until
+from .retry import retry_on_failure, wait_until, wait_for_event
 from .validation import (
     validate_symbol,
     validate_quantity,
@@ -17,6 +17,7 @@ __all__ = [
     "ActionLogger",
     "retry_on_failure",
     "wait_until",
+    "wait_for_event",
     "validate_symbol",
     "validate_quantity",
     "validate_price",
@@ -7,9 +7,12 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-import json
+import threading
+import time
+import weakref
+
+from .serialization import dumps
 
-_loggers: Dict[str, logging.Logger] = {}
 _initialized = False
 
 
@@ -67,12 +70,15 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance.
     """
-    full_name = f'tws_automation.{name}'
+    return logging.getLogger(f'tws_automation.{name}')
 
-    if full_name not in _loggers:
-        _loggers[full_name] = logging.getLogger(full_name)
 
-    return _loggers[full_name]
+def _format_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of action entry with ISO 8601 timestamp for output."""
+    return {
+        **entry,
+        'timestamp': datetime.fromtimestamp(entry['timestamp']).isoformat()
+    }
 
 
 class ActionLogger:
@@ -96,6 +102,17 @@ class ActionLogger:
         self.actions: List[Dict[str, Any]] = []
         self._logger = get_logger('ActionLogger')
 
+        # Log file stays open (line-buffered) after first write; closed
+        # by close(), when the logger is collected, or at exit
+        self._fp = None
+        self._fp_finalizer: Optional[weakref.finalize] = None
+        self._fp_lock = threading.Lock()
+
+        # Running totals for get_summary()
+        self._successful = 0
+        self._failed = 0
+        self._total_duration = 0.0
+
     def log_action(
         self,
         action_name: str,
@@ -112,8 +129,9 @@ class ActionLogger:
             result: Action result.
             duration: Execution time in seconds.
         """
+        # Epoch seconds; formatted as ISO 8601 only when written out
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'action': action_name,
             'params': params,
             'result': str(result),
@@ -122,6 +140,14 @@ class ActionLogger:
         }
 
         self.actions.append(entry)
+
+        success = entry['success']
+        if success:
+            self._successful += 1
+        elif success is False:
+            self._failed += 1
+        self._total_duration += duration
+
         self._logger.debug(f"Action: {action_name} ({duration:.3f}s)")
 
         # Write to file if path specified
@@ -131,11 +157,24 @@ class ActionLogger:
     def _write_entry(self, entry: dict) -> None:
         """Write single entry to log file."""
         try:
-            with open(self.log_path, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            line = dumps(_format_entry(entry), newline=True)
+            with self._fp_lock:
+                if self._fp is None:
+                    self._fp = open(self.log_path, 'a', buffering=1)
+                    self._fp_finalizer = weakref.finalize(self, self._fp.close)
+                self._fp.write(line)
         except Exception as e:
             self._logger.error(f"Failed to write action log: {e}")
 
+    def close(self) -> None:
+        """Close action log file."""
+        with self._fp_lock:
+            if self._fp_finalizer is not None:
+                # Closes the file and drops the exit hook
+                self._fp_finalizer()
+                self._fp_finalizer = None
+            self._fp = None
+
     def export(self, path: str) -> None:
         """
         Export action log to file.
@@ -145,7 +184,7 @@ class ActionLogger:
         """
         try:
             with open(path, 'w') as f:
-                json.dump(self.actions, f, indent=2)
+                f.write(dumps([_format_entry(a) for a in self.actions], indent=True))
             self._logger.info(f"Exported {len(self.actions)} actions to {path}")
         except Exception as e:
             self._logger.error(f"Failed to export action log: {e}")
@@ -153,6 +192,9 @@ class ActionLogger:
     def clear(self) -> None:
         """Clear in-memory action log."""
         self.actions.clear()
+        self._successful = 0
+        self._failed = 0
+        self._total_duration = 0.0
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -161,17 +203,14 @@ class ActionLogger:
         Returns:
             Summary dictionary with counts and timing.
         """
-        if not self.actions:
+        total = len(self.actions)
+        if not total:
             return {'total': 0}
 
-        successful = sum(1 for a in self.actions if a.get('success'))
-        failed = sum(1 for a in self.actions if a.get('success') is False)
-        total_duration = sum(a.get('duration', 0) for a in self.actions)
-
         return {
-            'total': len(self.actions),
-            'successful': successful,
-            'failed': failed,
-            'total_duration': total_duration,
-            'avg_duration': total_duration / len(self.actions)
+            'total': total,
+            'successful': self._successful,
+            'failed': self._failed,
+            'total_duration': self._total_duration,
+            'avg_duration': self._total_duration / total
         }
@@ -4,13 +4,20 @@ Retry utilities for handling transient failures.
 
 import time
 import functools
-from typing import Callable, Type, Tuple, Optional, TypeVar, Any
+import threading
+from typing import Callable, Type, Tuple, Optional, Sequence, TypeVar, Any
 import logging
 
+from ..core.exceptions import TimeoutError
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# wait_until() polls fast first, then backs off up to its interval
+POLL_START_INTERVAL = 0.01
+POLL_BACKOFF = 1.5
+
 
 def retry_on_failure(
     max_attempts: int = 3,
@@ -51,10 +58,11 @@ def retry_on_failure(
                     last_exception = e
 
                     if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_attempts} failed: {e}. "
-                            f"Retrying in {current_delay:.1f}s..."
-                        )
+                        if logger.isEnabledFor(logging.WARNING):
+                            logger.warning(
+                                "Attempt %d/%d failed: %s. Retrying in %.1fs...",
+                                attempt + 1, max_attempts, e, current_delay
+                            )
 
                         if on_retry:
                             on_retry(e, attempt + 1)
@@ -63,7 +71,8 @@ def retry_on_failure(
                         current_delay *= backoff
                     else:
                         logger.error(
-                            f"All {max_attempts} attempts failed for {func.__name__}"
+                            "All %d attempts failed for %s",
+                            max_attempts, func.__name__
                         )
 
             raise last_exception
@@ -76,16 +85,24 @@ def wait_until(
     condition: Callable[[], bool],
     timeout: float = 30.0,
     interval: float = 0.5,
-    message: str = "Condition not met"
+    message: str = "Condition not met",
+    transient: Tuple[Type[Exception], ...] = (Exception,)
 ) -> bool:
     """
     Wait until condition is true.
 
+    Checks quickly at first (every 10ms) and backs off
+    geometrically, so fast changes are caught with little
+    delay while long waits settle at one check per interval.
+
     Args:
         condition: Callable that returns True when ready.
         timeout: Maximum wait time in seconds.
-        interval: Check interval in seconds.
+        interval: Maximum check interval in seconds.
         message: Error message if timeout.
+        transient: Exceptions from condition treated as "not yet"
+            and retried; anything else propagates. Pass () to
+            let every exception through.
 
     Returns:
         True if condition met.
@@ -97,22 +114,102 @@ def wait_until(
         # Wait for element to appear
         wait_until(lambda: element.is_visible(), timeout=10)
     """
-    from ..core.exceptions import TimeoutError
-
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    current_interval = min(POLL_START_INTERVAL, interval)
 
-    while time.time() - start_time < timeout:
+    while True:
         try:
             if condition():
                 return True
-        except Exception as e:
+        except transient as e:
             logger.debug(f"Condition check failed: {e}")
 
-        time.sleep(interval)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        time.sleep(min(current_interval, remaining))
+        current_interval = min(current_interval * POLL_BACKOFF, interval)
+
+    raise TimeoutError(message, timeout)
+
+
+def wait_for_event(
+    event: Optional[threading.Event] = None,
+    timeout: float = 30.0,
+    message: str = "Event not signaled",
+    wait_handles: Optional[Sequence[int]] = None
+) -> bool:
+    """
+    Wait until event is signaled, without polling.
+
+    Blocks in the OS until the event fires, so there is no
+    polling delay and no CPU use while waiting. Use wait_until()
+    for conditions that have no underlying event.
+
+    Args:
+        event: threading.Event set by the producer.
+        timeout: Maximum wait time in seconds.
+        message: Error message if timeout.
+        wait_handles: Win32 waitable handles (events, processes)
+                     to wait on instead of event. Window messages
+                     are pumped while waiting.
+
+    Returns:
+        True if event signaled.
+
+    Raises:
+        TimeoutError: If event not signaled within timeout.
+        ValueError: If neither event nor wait_handles given.
+
+    Example:
+        # Worker thread calls done.set() when finished
+        wait_for_event(done, timeout=10, message="Worker finished")
+    """
+    if wait_handles:
+        if _wait_win32_handles(wait_handles, timeout):
+            return True
+    elif event is not None:
+        if event.wait(timeout):
+            return True
+    else:
+        raise ValueError("wait_for_event requires event or wait_handles")
 
     raise TimeoutError(message, timeout)
 
 
+def _wait_win32_handles(handles: Sequence[int], timeout: float) -> bool:
+    """
+    Wait until any Win32 handle is signaled.
+
+    Returns:
+        True if a handle was signaled, False on timeout.
+    """
+    import win32event
+    import win32gui
+
+    handles = list(handles)
+    count = len(handles)
+    deadline = time.monotonic() + timeout
+
+    while True:
+        remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        result = win32event.MsgWaitForMultipleObjects(
+            handles, False, remaining_ms, win32event.QS_ALLINPUT
+        )
+
+        if win32event.WAIT_OBJECT_0 <= result < win32event.WAIT_OBJECT_0 + count:
+            return True
+
+        if result == win32event.WAIT_OBJECT_0 + count:
+            # Window messages arrived, dispatch them and keep waiting
+            win32gui.PumpWaitingMessages()
+            if remaining_ms > 0:
+                continue
+
+        return False
+
+
 def wait_for_change(
     get_value: Callable[[], Any],
     timeout: float = 30.0,
@@ -132,12 +229,10 @@ def wait_for_change(
     Raises:
         TimeoutError: If value doesn't change within timeout.
     """
-    from ..core.exceptions import TimeoutError
-
     initial_value = get_value()
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
 
-    while time.time() - start_time < timeout:
+    while time.monotonic() < deadline:
         current_value = get_value()
         if current_value != initial_value:
             return current_value
@@ -163,9 +258,9 @@ def with_timeout(timeout: float) -> Callable:
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             if elapsed > timeout:
                 logger.warning(
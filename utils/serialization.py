@@ -0,0 +1,69 @@
+"""
+JSON serialization shared by tool results and action logs.
+
+Uses orjson when installed, stdlib json otherwise. Both write numpy
+scalars as numbers and numpy arrays as lists, turn int, float, bool
+and None dict keys into strings, and fall back to str() for any other
+value they cannot encode.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any, indent: bool = False, newline: bool = False) -> str:
+        """
+        Serialize object to JSON string (orjson).
+
+        Args:
+            obj: Object to serialize.
+            indent: Indent output by 2 spaces.
+            newline: Append trailing newline.
+
+        Returns:
+            JSON string.
+        """
+        option = _ORJSON_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+except ImportError:
+    import json
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    def _default(obj: Any) -> Any:
+        """Encode values json cannot, like orjson's numpy support."""
+        if np is not None:
+            if isinstance(obj, np.generic):
+                return obj.item()
+            if isinstance(obj, np.ndarray):
+                return obj.tolist()
+        return str(obj)
+
+    # json already writes int, float, bool and None keys as orjson's
+    # OPT_NON_STR_KEYS does ("1", "1.5", "true", "null")
+
+    def dumps(obj: Any, indent: bool = False, newline: bool = False) -> str:
+        """
+        Serialize object to JSON string (stdlib json fallback).
+
+        Args:
+            obj: Object to serialize.
+            indent: Indent output by 2 spaces.
+            newline: Append trailing newline.
+
+        Returns:
+            JSON string.
+        """
+        text = json.dumps(obj, default=_default, indent=2 if indent else None)
+        return text + '\n' if newline else text
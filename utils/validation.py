@@ -2,10 +2,37 @@
 Input validation utilities.
 """
 
+import functools
 import re
 from typing import Optional, Union
 from decimal import Decimal, InvalidOperation
 
+# Letters, dots (for class shares), and hyphens
+_SYMBOL_RE = re.compile(r'[A-Z]{1,5}(?:\.[A-Z])?(?:-[A-Z])?')
+
+# Valid values in display order (for error messages) and as sets for lookups
+_SIDES = ('BUY', 'SELL')
+_ORDER_TYPES = ('MKT', 'LMT', 'STP', 'STP_LMT', 'MIT', 'LIT')
+_TIMEFRAMES = (
+    '1m', '5m', '15m', '30m',
+    '1h', '1H', '4h', '4H',
+    '1d', '1D', '1w', '1W', '1M'
+)
+_VALID_SIDES = frozenset(_SIDES)
+_VALID_ORDER_TYPES = frozenset(_ORDER_TYPES)
+_VALID_TIMEFRAMES = frozenset(_TIMEFRAMES)
+
+# Results of the string validators below are memoized; only successful
+# normalizations are cached (exceptions are never stored). The public
+# functions check the type first, as lru_cache cannot hash e.g. lists.
+_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=64)
+def _to_decimal(value: Union[float, str, Decimal]) -> Decimal:
+    """Convert price bound to Decimal (cached, bounds rarely change)."""
+    return Decimal(str(value))
+
 
 class ValidationError(Exception):
     """
@@ -42,10 +69,18 @@ def validate_symbol(symbol: str) -> str:
     if not symbol or not isinstance(symbol, str):
         raise ValidationError("Symbol must be a non-empty string", "symbol")
 
-    symbol = symbol.strip().upper()
+    return _validate_symbol_str(symbol)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _validate_symbol_str(symbol: str) -> str:
+    """Normalize and check non-empty symbol string (cached)."""
+    # Already-normalized input (the common case) needs no new string
+    if not (symbol.isascii() and symbol.isupper()
+            and not symbol[0].isspace() and not symbol[-1].isspace()):
+        symbol = symbol.strip().upper()
 
-    # Allow letters, dots (for class shares), and hyphens
-    if not re.match(r'^[A-Z]{1,5}(\.[A-Z])?(-[A-Z])?$', symbol):
+    if not _SYMBOL_RE.fullmatch(symbol):
         raise ValidationError(
             f"Invalid symbol format: {symbol}. "
             "Must be 1-5 uppercase letters, optionally with .X or -X suffix.",
@@ -74,13 +109,16 @@ def validate_quantity(
     Raises:
         ValidationError: If quantity is invalid.
     """
-    try:
-        qty = int(quantity)
-    except (ValueError, TypeError):
-        raise ValidationError(
-            f"Quantity must be an integer, got: {quantity}",
-            "quantity"
-        )
+    if isinstance(quantity, int) and not isinstance(quantity, bool):
+        qty = quantity
+    else:
+        try:
+            qty = int(quantity)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                f"Quantity must be an integer, got: {quantity}",
+                "quantity"
+            )
 
     if qty < min_qty:
         raise ValidationError(
@@ -119,6 +157,9 @@ def validate_price(
     try:
         if isinstance(price, Decimal):
             price_decimal = price
+        elif isinstance(price, int) and not isinstance(price, bool):
+            # Exact conversion, no string round-trip
+            price_decimal = Decimal(price)
         else:
             price_decimal = Decimal(str(price))
     except (InvalidOperation, ValueError, TypeError):
@@ -127,13 +168,13 @@ def validate_price(
             "price"
         )
 
-    if price_decimal < Decimal(str(min_price)):
+    if price_decimal < _to_decimal(min_price):
         raise ValidationError(
             f"Price must be at least {min_price}, got: {price_decimal}",
             "price"
         )
 
-    if max_price is not None and price_decimal > Decimal(str(max_price)):
+    if max_price is not None and price_decimal > _to_decimal(max_price):
         raise ValidationError(
             f"Price {price_decimal} exceeds maximum {max_price}",
             "price"
@@ -157,10 +198,18 @@ def validate_side(side: str) -> str:
     """
     if not side:
         raise ValidationError("Side is required", "side")
+    if not isinstance(side, str):
+        raise ValidationError(f"Side must be a string, got: {side!r}", "side")
+
+    return _validate_side_str(side)
+
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _validate_side_str(side: str) -> str:
+    """Normalize and check non-empty side string (cached)."""
     side = side.strip().upper()
 
-    if side not in ('BUY', 'SELL'):
+    if side not in _VALID_SIDES:
         raise ValidationError(
             f"Side must be 'BUY' or 'SELL', got: {side}",
             "side"
@@ -182,16 +231,25 @@ def validate_order_type(order_type: str) -> str:
     Raises:
         ValidationError: If order type is invalid.
     """
-    valid_types = ('MKT', 'LMT', 'STP', 'STP_LMT', 'MIT', 'LIT')
-
     if not order_type:
         raise ValidationError("Order type is required", "order_type")
+    if not isinstance(order_type, str):
+        raise ValidationError(
+            f"Order type must be a string, got: {order_type!r}",
+            "order_type"
+        )
+
+    return _validate_order_type_str(order_type)
+
 
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _validate_order_type_str(order_type: str) -> str:
+    """Normalize and check non-empty order type string (cached)."""
     order_type = order_type.strip().upper()
 
-    if order_type not in valid_types:
+    if order_type not in _VALID_ORDER_TYPES:
         raise ValidationError(
-            f"Invalid order type: {order_type}. Valid types: {', '.join(valid_types)}",
+            f"Invalid order type: {order_type}. Valid types: {', '.join(_ORDER_TYPES)}",
             "order_type"
         )
 
@@ -211,18 +269,23 @@ def validate_timeframe(timeframe: str) -> str:
     Raises:
         ValidationError: If timeframe is invalid.
     """
-    valid_timeframes = (
-        '1m', '5m', '15m', '30m',
-        '1h', '1H', '4h', '4H',
-        '1d', '1D', '1w', '1W', '1M'
-    )
-
     if not timeframe:
         raise ValidationError("Timeframe is required", "timeframe")
+    if not isinstance(timeframe, str):
+        raise ValidationError(
+            f"Invalid timeframe: {timeframe}. Valid: {', '.join(_TIMEFRAMES)}",
+            "timeframe"
+        )
+
+    return _validate_timeframe_str(timeframe)
+
 
-    if timeframe not in valid_timeframes:
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _validate_timeframe_str(timeframe: str) -> str:
+    """Check non-empty timeframe string (cached)."""
+    if timeframe not in _VALID_TIMEFRAMES:
         raise ValidationError(
-            f"Invalid timeframe: {timeframe}. Valid: {', '.join(valid_timeframes)}",
+            f"Invalid timeframe: {timeframe}. Valid: {', '.join(_TIMEFRAMES)}",
             "timeframe"
         )
 